@@ -6,6 +6,7 @@ import argparse
 import json
 import sys
 from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Dict, Iterable, List, Sequence
 
@@ -49,6 +50,16 @@ from .website_manager import (
 )
 
 
+@lru_cache(maxsize=256)
+def _parse_cached(path: str, mtime_ns: int, size: int):
+    # Keyed on (path, mtime_ns, size) so repeated runs of an unchanged
+    # script skip the read+lex+parse pipeline; execution always gets a
+    # fresh Interpreter, so sharing the parsed Program is safe.
+    with open(path, "r", encoding="utf-8") as handle:
+        source = handle.read()
+    return parse(lex(source))
+
+
 def run_file(
     path: str,
     *,
@@ -57,10 +68,8 @@ def run_file(
     """Parse and execute a SAPL script from the filesystem."""
 
     script_path = Path(path).resolve()
-    with script_path.open("r", encoding="utf-8") as handle:
-        source = handle.read()
-    tokens = lex(source)
-    program = parse(tokens)
+    stat_result = script_path.stat()
+    program = _parse_cached(str(script_path), stat_result.st_mtime_ns, stat_result.st_size)
     interpreter = Interpreter(
         module_loader=ModuleLoader.from_script_path(script_path),
         plugins=plugins,
@@ -68,6 +77,11 @@ def run_file(
     return interpreter.execute(program)
 
 
+# Escape hatch for callers that rewrite a script faster than filesystem
+# timestamp resolution can register.
+run_file.cache_clear = _parse_cached.cache_clear  # type: ignore[attr-defined]
+
+
 def lint_file(path: str) -> List[LintMessage]:
     """Run the SAPL linter against a script file."""
 
@@ -262,7 +276,7 @@ def result_to_dict(result: ExecutionResult) -> dict:
 
 def _resolve_plugins(
     plugin_specs: Sequence[str], plugin_dirs: Sequence[str]
-) -> List[Callable[[Interpreter], None]]:
+) -> Sequence[Callable[[Interpreter], None]]:
     directories = [Path(directory) for directory in plugin_dirs]
     return load_plugins(plugin_specs, directories)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Dict, Iterator, List, Optional, Tuple
 
@@ -105,10 +106,10 @@ DELIMITERS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     type: str
-    value: str
+    value: str | int | float
     line: int
     column: int
     lexeme: Optional[str] = None
@@ -116,6 +117,8 @@ class Token:
     end: Optional[int] = None
 
     def __post_init__(self) -> None:
+        # Interned types allow pointer-equality checks in the parser hot path.
+        self.type = sys.intern(self.type)
         if self.lexeme is None:
             self.lexeme = self.value
 
@@ -394,7 +397,8 @@ class Lexer:
                 value_chars.append(self._peek())
                 self._advance()
         lexeme = "".join(value_chars)
-        return Token("NUMBER", lexeme, start_line, start_column, lexeme, start_index, start_index + len(lexeme))
+        value = float(lexeme) if "." in lexeme else int(lexeme)
+        return Token("NUMBER", value, start_line, start_column, lexeme, start_index, start_index + len(lexeme))
 
     def _identifier(self) -> Token:
         start_line, start_column = self.line, self.column
@@ -24,7 +24,9 @@ class LintMessage:
 
 
 _PLACEHOLDER_RE = re.compile(r"\{([a-zA-Z_][a-zA-Z0-9_]*)\}")
-_BUILTIN_NAMES = {"target", "targets", "scope"}
+_BUILTIN_NAMES = frozenset({"target", "targets", "scope"})
+_PAYLOAD_PREFIX = "payload_"
+_PAYLOAD_PREFIX_LEN = len(_PAYLOAD_PREFIX)
 
 
 class Linter:
@@ -305,8 +307,8 @@ class Linter:
                 continue
             if name in active_loops:
                 continue
-            if name.startswith("payload_"):
-                payload_name = name[len("payload_"):]
+            if name[:_PAYLOAD_PREFIX_LEN] == _PAYLOAD_PREFIX:
+                payload_name = name[_PAYLOAD_PREFIX_LEN:]
                 self.used_payloads.add(payload_name)
                 self.payload_placeholder_references.setdefault(payload_name, []).append(line)
             else:
@@ -11,14 +11,14 @@ from typing import Any, Dict, Iterable, List, Optional, Sequence
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Identifier:
     """Represents an identifier that should be resolved at runtime."""
 
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeReference:
     """Access an attribute on an expression."""
 
@@ -26,7 +26,7 @@ class AttributeReference:
     attribute: str
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexReference:
     """Access an indexed element within a collection."""
 
@@ -34,7 +34,7 @@ class IndexReference:
     index: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class CallExpression:
     """Represents a call expression."""
 
@@ -43,7 +43,7 @@ class CallExpression:
     kwargs: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class UnaryExpression:
     """Unary expression such as NOT expr or -expr."""
 
@@ -51,7 +51,7 @@ class UnaryExpression:
     operand: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class BinaryExpression:
     """Binary expression with an operator and two operands."""
 
@@ -60,35 +60,35 @@ class BinaryExpression:
     right: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ListExpression:
     """Literal list."""
 
     elements: List[Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class TupleExpression:
     """Literal tuple."""
 
     elements: List[Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class DictExpression:
     """Literal dictionary expression."""
 
     entries: List[tuple[Any, Any]]
 
 
-@dataclass
+@dataclass(slots=True)
 class SetExpression:
     """Literal set expression."""
 
     elements: List[Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ListComprehension:
     """List comprehension expression."""
 
@@ -98,7 +98,7 @@ class ListComprehension:
     condition: Any | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConditionalExpression:
     """Conditional expression of the form <true> IF <cond> ELSE <false>."""
 
@@ -107,7 +107,7 @@ class ConditionalExpression:
     if_false: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class LambdaExpression:
     """Lambda expression producing an inline callable."""
 
@@ -115,7 +115,7 @@ class LambdaExpression:
     body: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class AwaitExpression:
     """Await expression used to synchronise asynchronous results."""
 
@@ -130,38 +130,38 @@ Expression = Any
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Program:
     statements: List[Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class SetStatement:
     name: str
     value: Expression
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetStatement:
     value: Expression
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ScopeStatement:
     value: Expression
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PayloadStatement:
     name: str
     value: Expression
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskStatement:
     name: str
     body: Sequence[Any]
@@ -169,7 +169,7 @@ class TaskStatement:
     docstring: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ForStatement:
     iterator: str
     iterable: Expression
@@ -177,14 +177,14 @@ class ForStatement:
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PortScanStatement:
     ports: Expression
     tool: Expression | None
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class HttpRequestStatement:
     method: str
     target: Expression
@@ -193,7 +193,7 @@ class HttpRequestStatement:
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class FuzzStatement:
     resource: Expression
     method: str | None
@@ -202,33 +202,33 @@ class FuzzStatement:
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class NoteStatement:
     message: Expression
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class FindingStatement:
     severity: str
     message: Expression
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RunStatement:
     command: Expression
     save_as: str | None
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportStatement:
     destination: Expression
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AssignmentStatement:
     """General purpose variable assignment."""
 
@@ -237,7 +237,7 @@ class AssignmentStatement:
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AugmentedAssignmentStatement:
     """Augmented assignment (e.g. +=)."""
 
@@ -247,13 +247,13 @@ class AugmentedAssignmentStatement:
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpressionStatement:
     expression: Expression
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class IfStatement:
     condition: Expression
     body: Sequence[Any]
@@ -262,7 +262,7 @@ class IfStatement:
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class WhileStatement:
     condition: Expression
     body: Sequence[Any]
@@ -270,35 +270,35 @@ class WhileStatement:
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class BreakStatement:
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ContinueStatement:
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PassStatement:
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ReturnStatement:
     value: Optional[Expression]
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Parameter:
     name: str
     default: Optional[Expression] = None
     kind: str = "positional"
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionDefinition:
     name: str
     parameters: List[Parameter]
@@ -308,27 +308,27 @@ class FunctionDefinition:
     is_async: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class WithItem:
     context: Expression
     alias: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class WithStatement:
     items: List[WithItem]
     body: Sequence[Any]
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ExceptHandler:
     exception_type: Optional[Expression]
     alias: Optional[str]
     body: Sequence[Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class TryStatement:
     body: Sequence[Any]
     handlers: List[ExceptHandler]
@@ -337,38 +337,38 @@ class TryStatement:
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RaiseStatement:
     value: Optional[Expression]
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportItem:
     module: List[str]
     alias: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportStatement:
     items: List[ImportItem]
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class FromImportItem:
     name: str
     alias: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class FromImportStatement:
     module: List[str]
     items: List[FromImportItem]
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassDefinition:
     name: str
     bases: List[Expression]
@@ -377,14 +377,14 @@ class ClassDefinition:
     docstring: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InputStatement:
     prompt: Optional[Expression]
     target: Optional[str]
     line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputStatement:
     value: Expression
     line: int
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from .errors import ParseError
-from .lexer import BOOL_KEYWORDS, Token
+from .lexer import Token
 from . import nodes
 
 
@@ -30,13 +30,60 @@ BINARY_PRECEDENCE = {
 
 RIGHT_ASSOCIATIVE = {"POWER"}
 
+# Shared empty body for absent else/elif/finally blocks; AST consumers only
+# ever iterate these, so one immutable tuple replaces per-statement lists.
+_EMPTY: tuple = ()
+
+_HTTP_METHOD_TOKENS = frozenset({"IDENT", "STRING"})
+_DEPTH_OPEN = frozenset({"LPAREN", "LBRACKET", "LBRACE"})
+_DEPTH_CLOSE = frozenset({"RPAREN", "RBRACKET", "RBRACE"})
+_ELSE_TERMINATORS = frozenset({"COMMA", "COLON", "NEWLINE", "DEDENT", "EOF", "FOR"})
+
+_NEWLINE = "NEWLINE"
+_COMMENT = "COMMENT"
+_ASSIGN = "ASSIGN"
+
+_AUG_OPS = frozenset({"PLUSEQ", "MINUSEQ", "STAREQ", "SLASHEQ", "DBLSLASHEQ", "PERCENTEQ", "POWEQ"})
+
+# AST classes are never subclassed, so exact-type membership replaces isinstance.
+_ASSIGNABLE_TYPES = frozenset({nodes.Identifier, nodes.AttributeReference, nodes.IndexReference})
+_TUPLE_LIKE_TYPES = frozenset({nodes.TupleExpression, nodes.ListExpression})
+
 
 class Parser:
     """Recursive descent parser producing an AST from tokens."""
 
+    __slots__ = (
+        "tokens",
+        "position",
+        "_else_pending",
+        "_next_nonlayout",
+        "_has_assign",
+        "_ident_cache",
+    )
+
     def __init__(self, tokens: List[Token]) -> None:
+        # Duplicate the trailing EOF so one-token lookahead never needs a
+        # bounds check; the cursor stops on the first EOF regardless.
+        if tokens and tokens[-1].type == "EOF":
+            tokens = tokens + [tokens[-1]]
         self.tokens = tokens
         self.position = 0
+        self._else_pending: Optional[List[bool]] = None
+        self._has_assign: Optional[List[bool]] = None
+        self._ident_cache: dict[str, nodes.Identifier] = {}
+        # One reverse pass mapping every index to the next non-layout token,
+        # so skipping NEWLINE/COMMENT runs is a single assignment.
+        next_nonlayout = [0] * len(tokens)
+        nxt = len(tokens) - 1
+        for index in range(len(tokens) - 1, -1, -1):
+            token_type = tokens[index].type
+            if token_type is _NEWLINE or token_type is _COMMENT:
+                next_nonlayout[index] = nxt
+            else:
+                nxt = index
+                next_nonlayout[index] = index
+        self._next_nonlayout = next_nonlayout
 
     # Entry point ------------------------------------------------------
 
@@ -54,83 +101,28 @@ class Parser:
     # Layout helpers ---------------------------------------------------
 
     def _skip_layout(self) -> None:
-        while True:
-            if self._match("NEWLINE"):
-                continue
-            if self._match("COMMENT"):
-                continue
-            break
+        self.position = self._next_nonlayout[self.position]
 
     # Statement parsing ------------------------------------------------
 
     def _statement(self) -> nodes.Statement:
-        token = self._peek()
-        if token.type == "SET":
-            return self._parse_set()
-        if token.type == "TARGET":
-            return self._parse_target()
-        if token.type == "SCOPE":
-            return self._parse_scope()
-        if token.type == "PAYLOAD":
-            return self._parse_payload()
-        if token.type == "TASK":
-            return self._parse_task()
-        if token.type == "PORTSCAN":
-            return self._parse_portscan()
-        if token.type == "HTTP":
-            return self._parse_http()
-        if token.type == "FUZZ":
-            return self._parse_fuzz()
-        if token.type == "NOTE":
-            return self._parse_note()
-        if token.type == "FINDING":
-            return self._parse_finding()
-        if token.type == "RUN":
-            return self._parse_run()
-        if token.type == "REPORT":
-            return self._parse_report()
-        if token.type == "INPUT":
-            return self._parse_input()
-        if token.type == "OUTPUT":
-            return self._parse_output()
-        if token.type == "FOR":
-            return self._parse_for()
-        if token.type == "IF":
-            return self._parse_if()
-        if token.type == "WHILE":
-            return self._parse_while()
-        if token.type == "BREAK":
-            line = token.line
-            self._advance()
-            return nodes.BreakStatement(line)
-        if token.type == "CONTINUE":
-            line = token.line
-            self._advance()
-            return nodes.ContinueStatement(line)
-        if token.type == "PASS":
-            line = token.line
-            self._advance()
-            return nodes.PassStatement(line)
-        if token.type == "RETURN":
-            return self._parse_return()
-        if token.type == "DEF":
-            return self._parse_function()
-        if token.type == "ASYNC":
-            return self._parse_async()
-        if token.type == "CLASS":
-            return self._parse_class()
-        if token.type == "WITH":
-            return self._parse_with()
-        if token.type == "TRY":
-            return self._parse_try()
-        if token.type == "RAISE":
-            return self._parse_raise()
-        if token.type == "IMPORT":
-            return self._parse_import()
-        if token.type == "FROM":
-            return self._parse_from_import()
+        handler = _STATEMENT_DISPATCH.get(self.tokens[self.position].type)
+        if handler is not None:
+            return handler(self)
         return self._parse_assignment_or_expression()
 
+    def _parse_break(self) -> nodes.BreakStatement:
+        line = self._advance().line
+        return nodes.BreakStatement(line)
+
+    def _parse_continue(self) -> nodes.ContinueStatement:
+        line = self._advance().line
+        return nodes.ContinueStatement(line)
+
+    def _parse_pass(self) -> nodes.PassStatement:
+        line = self._advance().line
+        return nodes.PassStatement(line)
+
     def _parse_set(self) -> nodes.SetStatement:
         keyword = self._consume("SET")
         name = self._consume("IDENT", "Expected identifier after SET")
@@ -172,7 +164,7 @@ class Parser:
     def _parse_http(self) -> nodes.HttpRequestStatement:
         keyword = self._consume("HTTP")
         method_token = self._advance()
-        if method_token.type not in {"IDENT", "STRING"}:
+        if method_token.type not in _HTTP_METHOD_TOKENS:
             raise ParseError(method_token.line, method_token.column, "Expected HTTP method")
         method = method_token.value.upper()
         target = self._expression()
@@ -181,7 +173,7 @@ class Parser:
         if self._match("EXPECT"):
             expect_token = self._peek()
             if expect_token.type == "NUMBER":
-                expect_status = int(float(self._advance().value))
+                expect_status = int(self._advance().value)
             else:
                 raise ParseError(expect_token.line, expect_token.column, "Expected numeric status code")
         if self._match("CONTAINS"):
@@ -191,23 +183,31 @@ class Parser:
     def _parse_fuzz(self) -> nodes.FuzzStatement:
         keyword = self._consume("FUZZ")
         resource = self._expression()
-        method = None
-        payload_name = None
-        payloads_expr = None
+        options: dict[str, object] = {"method": None, "payload": None, "payloads_expr": None}
         while True:
-            if self._match("METHOD"):
-                method_token = self._consume("IDENT", "Expected method name after METHOD")
-                method = method_token.value.upper()
-                continue
-            if self._match("USING"):
-                payload_token = self._consume("IDENT", "Expected payload identifier after USING")
-                payload_name = payload_token.value
-                continue
-            if self._match("WITH"):
-                payloads_expr = self._expression()
-                continue
-            break
-        return nodes.FuzzStatement(resource, method, payload_name, payloads_expr, keyword.line)
+            handler = _FUZZ_OPTION_HANDLERS.get(self.tokens[self.position].type)
+            if handler is None:
+                break
+            self.position += 1
+            handler(self, options)
+        return nodes.FuzzStatement(
+            resource,
+            options["method"],
+            options["payload"],
+            options["payloads_expr"],
+            keyword.line,
+        )
+
+    def _fuzz_option_method(self, options: dict[str, object]) -> None:
+        method_token = self._consume("IDENT", "Expected method name after METHOD")
+        options["method"] = method_token.value.upper()
+
+    def _fuzz_option_using(self, options: dict[str, object]) -> None:
+        payload_token = self._consume("IDENT", "Expected payload identifier after USING")
+        options["payload"] = payload_token.value
+
+    def _fuzz_option_with(self, options: dict[str, object]) -> None:
+        options["payloads_expr"] = self._expression()
 
     def _parse_note(self) -> nodes.NoteStatement:
         keyword = self._consume("NOTE")
@@ -247,12 +247,14 @@ class Parser:
         keyword = self._consume("IF")
         condition = self._expression()
         body = self._parse_suite()
-        elif_blocks: List[tuple[nodes.Expression, List[nodes.Statement]]] = []
-        while self._match("ELIF"):
-            elif_condition = self._expression()
-            elif_body = self._parse_suite()
-            elif_blocks.append((elif_condition, elif_body))
-        else_body: List[nodes.Statement] = []
+        elif_blocks: Sequence[tuple[nodes.Expression, List[nodes.Statement]]] = _EMPTY
+        if self._check("ELIF"):
+            elif_blocks = []
+            while self._match("ELIF"):
+                elif_condition = self._expression()
+                elif_body = self._parse_suite()
+                elif_blocks.append((elif_condition, elif_body))
+        else_body: Sequence[nodes.Statement] = _EMPTY
         if self._match("ELSE"):
             else_body = self._parse_suite()
         return nodes.IfStatement(condition, body, elif_blocks, else_body, keyword.line)
@@ -261,7 +263,7 @@ class Parser:
         keyword = self._consume("WHILE")
         condition = self._expression()
         body = self._parse_suite()
-        else_body: List[nodes.Statement] = []
+        else_body: Sequence[nodes.Statement] = _EMPTY
         if self._match("ELSE"):
             else_body = self._parse_suite()
         return nodes.WhileStatement(condition, body, else_body, keyword.line)
@@ -344,8 +346,8 @@ class Parser:
                     alias = alias_token.value
             handler_body = self._parse_suite()
             handlers.append(nodes.ExceptHandler(exception_type, alias, handler_body))
-        else_body: List[nodes.Statement] = []
-        finally_body: List[nodes.Statement] = []
+        else_body: Sequence[nodes.Statement] = _EMPTY
+        finally_body: Sequence[nodes.Statement] = _EMPTY
         if self._match("ELSE"):
             else_body = self._parse_suite()
         if self._match("FINALLY"):
@@ -397,38 +399,71 @@ class Parser:
         return nodes.FromImportStatement(module, items, keyword.line)
 
     def _parse_assignment_or_expression(self) -> nodes.Statement:
+        table = self._has_assign
+        if table is None:
+            table = self._build_has_assign()
+            self._has_assign = table
+        if not table[self.position]:
+            expr = self._expression()
+            return nodes.ExpressionStatement(expr, self._previous().line)
         expr = self._expression()
         if self._match("ASSIGN"):
             value = self._expression()
             targets = self._collect_assignment_targets(expr)
             return nodes.AssignmentStatement(targets, value, self._previous().line)
-        for op_token in ("PLUSEQ", "MINUSEQ", "STAREQ", "SLASHEQ", "DBLSLASHEQ", "PERCENTEQ", "POWEQ"):
-            if self._match(op_token):
-                value = self._expression()
-                target = self._ensure_assignment_target(expr)
-                return nodes.AugmentedAssignmentStatement(target, op_token, value, self._previous().line)
+        peek_type = self.tokens[self.position].type
+        if peek_type in _AUG_OPS:
+            self.position += 1
+            value = self._expression()
+            target = self._ensure_assignment_target(expr)
+            return nodes.AugmentedAssignmentStatement(target, peek_type, value, self._previous().line)
         return nodes.ExpressionStatement(expr, self._previous().line)
 
+    def _build_has_assign(self) -> List[bool]:
+        """Precompute whether an assignment operator occurs later on each line.
+
+        One reverse pass setting the flag at ASSIGN/augmented operators and
+        clearing it at line boundaries. False positives (e.g. a lambda
+        default inside an expression statement) merely fall back to the
+        normal post-expression checks.
+        """
+
+        tokens = self.tokens
+        table = [False] * len(tokens)
+        flag = False
+        for index in range(len(tokens) - 1, -1, -1):
+            token_type = tokens[index].type
+            if token_type is _NEWLINE:
+                flag = False
+            elif token_type is _ASSIGN or token_type in _AUG_OPS:
+                flag = True
+            table[index] = flag
+        return table
+
     def _collect_assignment_targets(self, expr: nodes.Expression) -> List[nodes.Identifier | nodes.AttributeReference | nodes.IndexReference]:
-        if isinstance(expr, (nodes.Identifier, nodes.AttributeReference, nodes.IndexReference)):
+        if type(expr) in _ASSIGNABLE_TYPES:
             return [expr]
-        if isinstance(expr, nodes.TupleExpression):
-            return [self._ensure_assignment_target(item) for item in expr.elements]
-        if isinstance(expr, nodes.ListExpression):
-            return [self._ensure_assignment_target(item) for item in expr.elements]
+        if type(expr) in _TUPLE_LIKE_TYPES:
+            ensure = self._ensure_assignment_target
+            return [ensure(item) for item in expr.elements]
         raise ParseError(self._previous().line, self._previous().column, "Invalid assignment target")
 
     def _ensure_assignment_target(self, expr: nodes.Expression) -> nodes.Identifier | nodes.AttributeReference | nodes.IndexReference:
-        if isinstance(expr, (nodes.Identifier, nodes.AttributeReference, nodes.IndexReference)):
+        if type(expr) in _ASSIGNABLE_TYPES:
             return expr
         raise ParseError(self._previous().line, self._previous().column, "Invalid assignment target")
 
     # Expression parsing ------------------------------------------------
 
     def _expression(self, precedence: int = 0) -> nodes.Expression:
+        precedence_get = BINARY_PRECEDENCE.get
+        right_associative = RIGHT_ASSOCIATIVE
+        peek = self._peek
+        advance = self._advance
+        binary_expression = nodes.BinaryExpression
         expr = self._prefix()
         while True:
-            token = self._peek()
+            token = peek()
             if token.type == "IF" and precedence <= 0:
                 if not self._conditional_else_pending():
                     break
@@ -452,130 +487,172 @@ class Parser:
             if token.type == "LPAREN":
                 expr = self._finish_call(expr)
                 continue
-            if token.type not in BINARY_PRECEDENCE:
-                break
-            op_precedence = BINARY_PRECEDENCE[token.type]
+            op_precedence = precedence_get(token.type, -1)
             if op_precedence < precedence:
                 break
-            operator_token = self._advance()
-            next_precedence = op_precedence + (0 if operator_token.type in RIGHT_ASSOCIATIVE else 1)
+            operator_token = advance()
+            next_precedence = op_precedence + (0 if operator_token.type in right_associative else 1)
             right = self._expression(next_precedence)
-            expr = nodes.BinaryExpression(operator_token.type, expr, right)
+            expr = binary_expression(operator_token.type, expr, right)
         return expr
 
     def _prefix(self) -> nodes.Expression:
         token = self._advance()
-        if token.type == "NUMBER":
-            if "." in token.value:
-                return float(token.value)
-            return int(token.value)
-        if token.type == "STRING":
-            return token.value
-        if token.type in BOOL_KEYWORDS:
-            return BOOL_KEYWORDS[token.type]
-        if token.type == "IDENT":
-            return nodes.Identifier(token.value)
-        if token.type == "LPAREN":
-            expr = self._expression()
-            if self._match("COMMA"):
-                elements = [expr]
-                while True:
-                    elements.append(self._expression())
-                    if self._match("COMMA"):
-                        continue
-                    break
-                self._consume("RPAREN", "Expected closing ')' for tuple")
-                return nodes.TupleExpression(elements)
-            self._consume("RPAREN", "Expected closing ')' for grouping")
-            return expr
-        if token.type == "LBRACKET":
-            elements: List[nodes.Expression] = []
-            if self._check("RBRACKET"):
-                self._advance()
-                return nodes.ListExpression(elements)
-            first = self._expression()
-            if self._match("FOR"):
-                iterator = self._consume("IDENT", "Expected identifier in list comprehension")
-                self._consume("IN", "Expected IN in list comprehension")
-                iterable = self._expression()
-                condition = None
-                if self._match("IF"):
-                    condition = self._expression()
-                self._consume("RBRACKET", "Expected closing ']' for list comprehension")
-                return nodes.ListComprehension(first, iterator.value, iterable, condition)
-            elements.append(first)
-            while self._match("COMMA"):
-                if self._check("RBRACKET"):
-                    break
-                elements.append(self._expression())
-            self._consume("RBRACKET", "Expected closing ']' for list")
+        handler = _PREFIX_DISPATCH.get(token.type)
+        if handler is None:
+            raise ParseError(token.line, token.column, f"Unexpected token {token.type}")
+        return handler(self, token)
+
+    def _prefix_number(self, token: Token) -> nodes.Expression:
+        # The lexer already converted the lexeme to int/float.
+        return token.value
+
+    def _prefix_string(self, token: Token) -> nodes.Expression:
+        return token.value
+
+    def _prefix_true(self, token: Token) -> nodes.Expression:
+        return True
+
+    def _prefix_false(self, token: Token) -> nodes.Expression:
+        return False
+
+    def _prefix_none(self, token: Token) -> nodes.Expression:
+        return None
+
+    def _prefix_identifier(self, token: Token) -> nodes.Expression:
+        # Repeated references to the same name share one Identifier node;
+        # consumers only ever read .name, so the sharing is safe.
+        cache = self._ident_cache
+        node = cache.get(token.value)
+        if node is None:
+            node = nodes.Identifier(token.value)
+            cache[token.value] = node
+        return node
+
+    def _prefix_group(self, token: Token) -> nodes.Expression:
+        expr = self._expression()
+        if self._match("COMMA"):
+            elements = [expr]
+            expression = self._expression
+            match = self._match
+            append = elements.append
+            while True:
+                append(expression())
+                if match("COMMA"):
+                    continue
+                break
+            self._consume("RPAREN", "Expected closing ')' for tuple")
+            return nodes.TupleExpression(elements)
+        self._consume("RPAREN", "Expected closing ')' for grouping")
+        return expr
+
+    def _prefix_list(self, token: Token) -> nodes.Expression:
+        elements: List[nodes.Expression] = []
+        if self._check("RBRACKET"):
+            self._advance()
             return nodes.ListExpression(elements)
-        if token.type == "LBRACE":
-            if self._check("RBRACE"):
-                self._advance()
-                return nodes.DictExpression([])
-            first = self._expression()
-            if self._match("COLON"):
-                value = self._expression()
-                entries: List[tuple[nodes.Expression, nodes.Expression]] = [(first, value)]
-                while self._match("COMMA"):
-                    if self._check("RBRACE"):
-                        break
-                    key = self._expression()
-                    self._consume("COLON", "Expected ':' in dictionary literal")
-                    value = self._expression()
-                    entries.append((key, value))
-                self._consume("RBRACE", "Expected closing '}' for dictionary")
-                return nodes.DictExpression(entries)
-            elements: List[nodes.Expression] = [first]
-            while self._match("COMMA"):
-                if self._check("RBRACE"):
-                    break
-                elements.append(self._expression())
-            self._consume("RBRACE", "Expected closing '}' for set literal")
-            return nodes.SetExpression(elements)
-        if token.type == "MINUS":
-            operand = self._expression(BINARY_PRECEDENCE["POWER"] + 1)
-            return nodes.UnaryExpression("NEGATE", operand)
-        if token.type == "PLUS":
-            operand = self._expression(BINARY_PRECEDENCE["POWER"] + 1)
-            return nodes.UnaryExpression("POSITIVE", operand)
-        if token.type == "NOT":
-            operand = self._expression(BINARY_PRECEDENCE["AND"])
-            return nodes.UnaryExpression("NOT", operand)
-        if token.type == "LAMBDA":
-            parameters: List[nodes.Parameter] = []
-            if not self._check("COLON"):
-                while True:
-                    param_name = self._consume("IDENT", "Expected parameter name in lambda")
-                    default = None
-                    if self._match("ASSIGN"):
-                        default = self._expression()
-                    parameters.append(nodes.Parameter(param_name.value, default))
-                    if self._match("COMMA"):
-                        continue
+        first = self._expression()
+        if self._match("FOR"):
+            iterator = self._consume("IDENT", "Expected identifier in list comprehension")
+            self._consume("IN", "Expected IN in list comprehension")
+            iterable = self._expression()
+            condition = None
+            if self._match("IF"):
+                condition = self._expression()
+            self._consume("RBRACKET", "Expected closing ']' for list comprehension")
+            return nodes.ListComprehension(first, iterator.value, iterable, condition)
+        elements.append(first)
+        expression = self._expression
+        match = self._match
+        check = self._check
+        append = elements.append
+        while match("COMMA"):
+            if check("RBRACKET"):
+                break
+            append(expression())
+        self._consume("RBRACKET", "Expected closing ']' for list")
+        return nodes.ListExpression(elements)
+
+    def _prefix_brace(self, token: Token) -> nodes.Expression:
+        if self._check("RBRACE"):
+            self._advance()
+            return nodes.DictExpression([])
+        first = self._expression()
+        expression = self._expression
+        match = self._match
+        check = self._check
+        if match("COLON"):
+            value = expression()
+            entries: List[tuple[nodes.Expression, nodes.Expression]] = [(first, value)]
+            entries_append = entries.append
+            consume = self._consume
+            while match("COMMA"):
+                if check("RBRACE"):
                     break
-            self._consume("COLON", "Expected ':' after lambda parameters")
-            body = self._expression()
-            return nodes.LambdaExpression(parameters, body)
-        if token.type == "AWAIT":
-            expr = self._expression()
-            return nodes.AwaitExpression(expr)
-        raise ParseError(token.line, token.column, f"Unexpected token {token.type}")
+                key = expression()
+                consume("COLON", "Expected ':' in dictionary literal")
+                value = expression()
+                entries_append((key, value))
+            self._consume("RBRACE", "Expected closing '}' for dictionary")
+            return nodes.DictExpression(entries)
+        elements: List[nodes.Expression] = [first]
+        append = elements.append
+        while match("COMMA"):
+            if check("RBRACE"):
+                break
+            append(expression())
+        self._consume("RBRACE", "Expected closing '}' for set literal")
+        return nodes.SetExpression(elements)
+
+    def _prefix_minus(self, token: Token) -> nodes.Expression:
+        operand = self._expression(BINARY_PRECEDENCE["POWER"] + 1)
+        return nodes.UnaryExpression("NEGATE", operand)
+
+    def _prefix_plus(self, token: Token) -> nodes.Expression:
+        operand = self._expression(BINARY_PRECEDENCE["POWER"] + 1)
+        return nodes.UnaryExpression("POSITIVE", operand)
+
+    def _prefix_not(self, token: Token) -> nodes.Expression:
+        operand = self._expression(BINARY_PRECEDENCE["AND"])
+        return nodes.UnaryExpression("NOT", operand)
+
+    def _prefix_lambda(self, token: Token) -> nodes.Expression:
+        parameters: List[nodes.Parameter] = []
+        if not self._check("COLON"):
+            while True:
+                param_name = self._consume("IDENT", "Expected parameter name in lambda")
+                default = None
+                if self._match("ASSIGN"):
+                    default = self._expression()
+                parameters.append(nodes.Parameter(param_name.value, default))
+                if self._match("COMMA"):
+                    continue
+                break
+        self._consume("COLON", "Expected ':' after lambda parameters")
+        body = self._expression()
+        return nodes.LambdaExpression(parameters, body)
+
+    def _prefix_await(self, token: Token) -> nodes.Expression:
+        expr = self._expression()
+        return nodes.AwaitExpression(expr)
 
     def _finish_call(self, callee: nodes.Expression) -> nodes.Expression:
         lparen = self._consume("LPAREN", "Expected '(' to start call")
         args: List[nodes.Expression] = []
         kwargs: dict[str, nodes.Expression] = {}
         if not self._check("RPAREN"):
+            expression = self._expression
+            match = self._match
+            check = self._check
+            args_append = args.append
             while True:
-                if self._check("IDENT") and self._peek_next().type == "ASSIGN":
+                if check("IDENT") and self._peek_next().type == "ASSIGN":
                     name = self._advance().value
                     self._consume("ASSIGN", "Expected '=' in keyword argument")
-                    kwargs[name] = self._expression()
+                    kwargs[name] = expression()
                 else:
-                    args.append(self._expression())
-                if self._match("COMMA"):
+                    args_append(expression())
+                if match("COMMA"):
                     continue
                 break
         self._consume("RPAREN", "Expected ')' to close call")
@@ -643,20 +720,19 @@ class Parser:
     # Token helpers ----------------------------------------------------
 
     def _match(self, token_type: str) -> bool:
-        if self._check(token_type):
-            self._advance()
+        if self.tokens[self.position].type is token_type:
+            self.position += 1
             return True
         return False
 
     def _check(self, token_type: str) -> bool:
-        return self._peek().type == token_type
+        # Token types are interned by the lexer, so identity comparison holds.
+        return self.tokens[self.position].type is token_type
 
     def _peek(self) -> Token:
         return self.tokens[self.position]
 
     def _peek_next(self) -> Token:
-        if self.position + 1 >= len(self.tokens):
-            return self.tokens[-1]
         return self.tokens[self.position + 1]
 
     def _advance(self) -> Token:
@@ -668,23 +744,44 @@ class Parser:
         return self.tokens[self.position - 1]
 
     def _conditional_else_pending(self) -> bool:
-        depth = 0
-        index = self.position
-        while index < len(self.tokens):
-            token = self.tokens[index]
-            if token.type in {"LPAREN", "LBRACKET", "LBRACE"}:
-                depth += 1
-            elif token.type in {"RPAREN", "RBRACKET", "RBRACE"}:
-                if depth == 0 and token.type in {"RBRACKET", "RBRACE"}:
-                    return False
-                depth = max(depth - 1, 0)
-            elif depth == 0:
-                if token.type == "ELSE":
-                    return True
-                if token.type in {"COMMA", "COLON", "NEWLINE", "DEDENT", "EOF", "FOR"}:
-                    return False
-            index += 1
-        return False
+        table = self._else_pending
+        if table is None:
+            table = self._build_else_pending()
+            self._else_pending = table
+        return table[self.position]
+
+    def _build_else_pending(self) -> List[bool]:
+        """Precompute, for every index, whether a depth-zero ELSE is pending.
+
+        Replaces the previous per-IF forward scan (O(N) each, O(N^2) worst
+        case on nested conditionals) with one bracket-matching pass and one
+        reverse propagation pass.
+        """
+
+        tokens = self.tokens
+        count = len(tokens)
+        matches: dict[int, int] = {}
+        stack: List[int] = []
+        for index in range(count):
+            token_type = tokens[index].type
+            if token_type in _DEPTH_OPEN:
+                stack.append(index)
+            elif token_type in _DEPTH_CLOSE and stack:
+                matches[stack.pop()] = index
+        table = [False] * (count + 1)
+        for index in range(count - 1, -1, -1):
+            token_type = tokens[index].type
+            if token_type == "ELSE":
+                table[index] = True
+            elif token_type in _ELSE_TERMINATORS or token_type == "RBRACKET" or token_type == "RBRACE":
+                table[index] = False
+            elif token_type in _DEPTH_OPEN:
+                match = matches.get(index)
+                table[index] = table[match + 1] if match is not None else False
+            else:
+                # Plain tokens and unbalanced RPAREN continue the scan.
+                table[index] = table[index + 1]
+        return table
 
     def _consume(self, token_type: str, message: Optional[str] = None) -> Token:
         if self._check(token_type):
@@ -693,6 +790,69 @@ class Parser:
         raise ParseError(token.line, token.column, message or f"Expected token {token_type}")
 
 
+# FUZZ option keywords dispatch through one hashed lookup per iteration.
+# Prefix handlers keyed by the token type that introduces the expression;
+# literals and identifiers dominate real inputs so they resolve in one lookup.
+_PREFIX_DISPATCH = {
+    "NUMBER": Parser._prefix_number,
+    "STRING": Parser._prefix_string,
+    "IDENT": Parser._prefix_identifier,
+    "LPAREN": Parser._prefix_group,
+    "LBRACKET": Parser._prefix_list,
+    "LBRACE": Parser._prefix_brace,
+    "MINUS": Parser._prefix_minus,
+    "PLUS": Parser._prefix_plus,
+    "NOT": Parser._prefix_not,
+    "LAMBDA": Parser._prefix_lambda,
+    "AWAIT": Parser._prefix_await,
+    "TRUE": Parser._prefix_true,
+    "FALSE": Parser._prefix_false,
+    "NONE": Parser._prefix_none,
+}
+
+
+_FUZZ_OPTION_HANDLERS = {
+    "METHOD": Parser._fuzz_option_method,
+    "USING": Parser._fuzz_option_using,
+    "WITH": Parser._fuzz_option_with,
+}
+
+
+# Built once after the class body so each entry is a plain function reference;
+# statement dispatch is a single hashed lookup instead of ~30 comparisons.
+_STATEMENT_DISPATCH = {
+    "SET": Parser._parse_set,
+    "TARGET": Parser._parse_target,
+    "SCOPE": Parser._parse_scope,
+    "PAYLOAD": Parser._parse_payload,
+    "TASK": Parser._parse_task,
+    "PORTSCAN": Parser._parse_portscan,
+    "HTTP": Parser._parse_http,
+    "FUZZ": Parser._parse_fuzz,
+    "NOTE": Parser._parse_note,
+    "FINDING": Parser._parse_finding,
+    "RUN": Parser._parse_run,
+    "REPORT": Parser._parse_report,
+    "INPUT": Parser._parse_input,
+    "OUTPUT": Parser._parse_output,
+    "FOR": Parser._parse_for,
+    "IF": Parser._parse_if,
+    "WHILE": Parser._parse_while,
+    "BREAK": Parser._parse_break,
+    "CONTINUE": Parser._parse_continue,
+    "PASS": Parser._parse_pass,
+    "RETURN": Parser._parse_return,
+    "DEF": Parser._parse_function,
+    "ASYNC": Parser._parse_async,
+    "CLASS": Parser._parse_class,
+    "WITH": Parser._parse_with,
+    "TRY": Parser._parse_try,
+    "RAISE": Parser._parse_raise,
+    "IMPORT": Parser._parse_import,
+    "FROM": Parser._parse_from_import,
+}
+
+
 def parse(tokens: List[Token]) -> nodes.Program:
     """Helper function to build an AST from the token sequence."""
 
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import importlib
-import importlib.util
+import os
+import stat
+import sys
 from pathlib import Path
+from types import ModuleType
 from typing import Callable, List, Sequence
+from weakref import WeakKeyDictionary
 
 from .errors import SAPLError
 
@@ -22,6 +27,13 @@ class PluginError(SAPLError):
 def _wrap_plugin(hook: Callable[["Interpreter"], None], source: str) -> PluginHook:
     if not callable(hook):
         raise PluginError(f"Plugin entry point '{source}' is not callable")
+    try:
+        # Stamp the name on the original callable; a wrapper closure would
+        # add a Python call frame to every plugin invocation.
+        hook.__sapl_plugin_name__ = source  # type: ignore[attr-defined]
+        return hook
+    except (AttributeError, TypeError):
+        pass
 
     def wrapper(interpreter: "Interpreter") -> None:
         hook(interpreter)
@@ -30,15 +42,15 @@ def _wrap_plugin(hook: Callable[["Interpreter"], None], source: str) -> PluginHo
     return wrapper
 
 
-def load_plugin(spec: str) -> PluginHook:
-    """Load a plugin specified as ``module[:attribute]``."""
-
-    module_name, _, attribute = spec.partition(":")
-    if not module_name:
-        raise PluginError("Plugin specification must include a module name")
-    module = importlib.import_module(module_name)
-    if not attribute:
-        attribute = "register"
+@functools.lru_cache(maxsize=None)
+def _resolve_plugin(module_name: str, attribute: str) -> PluginHook:
+    # Peek sys.modules first; import_module acquires the import lock and
+    # walks the finders even for modules that are already loaded.
+    modules = sys.modules
+    module = modules.get(module_name)
+    if module is None:
+        importlib.import_module(module_name)
+        module = modules[module_name]
     if not hasattr(module, attribute):
         raise PluginError(
             f"Plugin '{module_name}' does not expose attribute '{attribute}'"
@@ -47,58 +59,223 @@ def load_plugin(spec: str) -> PluginHook:
     return _wrap_plugin(hook, f"{module_name}:{attribute}")
 
 
+def load_plugin(spec: str) -> PluginHook:
+    """Load a plugin specified as ``module[:attribute]``."""
+
+    sep = spec.find(":")
+    if sep == -1:
+        module_name, attribute = spec, "register"
+    else:
+        module_name = spec[:sep]
+        attribute = spec[sep + 1 :] or "register"
+    if not module_name:
+        raise PluginError("Plugin specification must include a module name")
+    # Interned keys make the memo lookup a pointer comparison.
+    return _resolve_plugin(sys.intern(module_name), sys.intern(attribute))
+
+
+load_plugin.cache_clear = _resolve_plugin.cache_clear  # type: ignore[attr-defined]
+
+
+# Executed plugin modules keyed by (path, mtime_ns, size) so repeated
+# directory scans skip re-parsing and re-running unchanged files.
+_MODULE_CACHE: dict[tuple[str, int, int], ModuleType] = {}
+
+# Hook lists per directory, keyed by the stat signature of its candidate
+# files; a directory whose plugins are unchanged skips module loading and
+# hook wrapping entirely.  File mtimes (not the directory's) make the key
+# sensitive to in-place edits.
+_DIRECTORY_CACHE: dict[str, tuple[tuple, List[PluginHook]]] = {}
+
+# str.endswith with a tuple argument is a single C-level check.
+_PLUGIN_SUFFIXES = (".py",)
+
+
+def clear_plugin_cache() -> None:
+    """Forget previously executed plugin modules."""
+
+    _MODULE_CACHE.clear()
+    _DIRECTORY_CACHE.clear()
+
+
+def _candidate_plugin_files(directory: Path) -> List[tuple[Path, os.stat_result]]:
+    # One scandir pass instead of glob's per-pattern traversal + fnmatch.
+    # DirEntry.stat() reuses metadata from the directory read where the
+    # platform provides it, so the cache key below costs no extra syscall.
+    with os.scandir(directory) as entries:
+        candidates = [
+            (entry.name, entry.stat())
+            for entry in entries
+            if entry.name.endswith(_PLUGIN_SUFFIXES) and entry.is_file()
+        ]
+    candidates.sort()
+    return [(directory / name, stat_result) for name, stat_result in candidates]
+
+
+def _load_module_from_path(
+    file_path: Path,
+    module_name: str,
+    stat_result: os.stat_result | None = None,
+) -> ModuleType:
+    import importlib.util
+
+    caching = not os.environ.get("SAPL_DISABLE_PLUGIN_CACHE")
+    if caching:
+        if stat_result is None:
+            stat_result = file_path.stat()
+        key = (str(file_path), stat_result.st_mtime_ns, stat_result.st_size)
+        module = _MODULE_CACHE.get(key)
+        if module is not None:
+            return module
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    if spec is None or spec.loader is None:
+        raise PluginError(f"Unable to load plugin from '{file_path}'")
+    module = importlib.util.module_from_spec(spec)
+    # Register before executing so plugin-to-plugin imports (and circular
+    # imports within a plugin) resolve through sys.modules.
+    sys.modules[module_name] = module
+    loader = spec.loader
+    assert loader is not None  # for type checkers
+    try:
+        loader.exec_module(module)  # type: ignore[call-arg]
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    if caching:
+        _MODULE_CACHE[key] = module
+    return module
+
+
 def load_plugins_from_directory(directory: Path) -> List[PluginHook]:
     """Load all plugins from ``*.py`` files within *directory*."""
 
     hooks: List[PluginHook] = []
     directory = directory.resolve()
-    if not directory.exists():
-        raise PluginError(f"Plugin directory '{directory}' does not exist")
-    if not directory.is_dir():
+    # One stat call validates existence and kind in a single syscall.
+    try:
+        directory_stat = os.stat(directory)
+    except FileNotFoundError:
+        raise PluginError(f"Plugin directory '{directory}' does not exist") from None
+    if not stat.S_ISDIR(directory_stat.st_mode):
         raise PluginError(f"Plugin path '{directory}' is not a directory")
-    for index, file_path in enumerate(sorted(directory.glob("*.py"))):
-        module_name = f"sapl_plugin_{file_path.stem}_{index}"
-        spec = importlib.util.spec_from_file_location(module_name, file_path)
-        if spec is None or spec.loader is None:
-            raise PluginError(f"Unable to load plugin from '{file_path}'")
-        module = importlib.util.module_from_spec(spec)
-        loader = spec.loader
-        assert loader is not None  # for type checkers
-        loader.exec_module(module)  # type: ignore[call-arg]
-        hook = getattr(module, "register", None)
-        if hook is None:
-            raise PluginError(
-                f"Plugin file '{file_path}' must define a callable 'register'"
+    candidates = _candidate_plugin_files(directory)
+    caching = not os.environ.get("SAPL_DISABLE_PLUGIN_CACHE")
+    directory_key = str(directory)
+    signature = tuple(
+        (str(file_path), stat_result.st_mtime_ns, stat_result.st_size)
+        for file_path, stat_result in candidates
+    )
+    if caching:
+        cached = _DIRECTORY_CACHE.get(directory_key)
+        if cached is not None and cached[0] == signature:
+            return list(cached[1])
+    # Modules execute strictly in sorted filename order: plugin bodies run
+    # arbitrary top-level code and may import siblings, so concurrent
+    # execution could expose partially-initialised modules.  Bare file
+    # stems are aliased in sys.modules only for the duration of the load,
+    # so a later sibling can ``import <stem>``; leaving them registered
+    # would shadow real packages of the same name process-wide.
+    registered_stems: List[str] = []
+    try:
+        modules: List[ModuleType] = []
+        for index, (file_path, stat_result) in enumerate(candidates):
+            module = _load_module_from_path(
+                file_path, f"sapl_plugin_{file_path.stem}_{index}", stat_result
             )
-        hooks.append(_wrap_plugin(hook, str(file_path)))
+            modules.append(module)
+            stem = file_path.stem
+            if stem not in sys.modules:
+                sys.modules[stem] = module
+                registered_stems.append(stem)
+        for (file_path, _), module in zip(candidates, modules):
+            hook = getattr(module, "register", None)
+            if hook is None:
+                raise PluginError(
+                    f"Plugin file '{file_path}' must define a callable 'register'"
+                )
+            hooks.append(_wrap_plugin(hook, str(file_path)))
+    finally:
+        for stem in registered_stems:
+            sys.modules.pop(stem, None)
+    if caching:
+        _DIRECTORY_CACHE[directory_key] = (signature, hooks)
+        return list(hooks)
     return hooks
 
 
+_EMPTY: tuple = ()
+
+
 def load_plugins(
     specs: Sequence[str] | None = None,
     directories: Sequence[Path] | None = None,
-) -> List[PluginHook]:
+) -> Sequence[PluginHook]:
     """Return plugin hooks from module specs and directories."""
 
+    if not specs and not directories:
+        return _EMPTY
     hooks: List[PluginHook] = []
-    for spec in specs or []:
+    for spec in specs or _EMPTY:
         hooks.append(load_plugin(spec))
-    for directory in directories or []:
+    for directory in directories or _EMPTY:
         hooks.extend(load_plugins_from_directory(directory))
-    return hooks
+    return tuple(hooks)
+
+
+def compile_dispatcher(hooks: Sequence[PluginHook]) -> Callable[["Interpreter"], None]:
+    """Build a dispatcher that calls every hook in *hooks* in order.
+
+    The generated function is a straight-line sequence of calls, avoiding
+    the per-hook loop overhead when many plugins are applied per
+    interpreter (e.g. in server contexts).  Dispatchers are memoised on
+    the hook tuple: the codegen cost is paid once per distinct plugin
+    set, so constructing many interpreters with the same hooks reuses
+    one compiled function.
+    """
+
+    return _compile_dispatcher(tuple(hooks))
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_dispatcher(hooks: tuple) -> Callable[["Interpreter"], None]:
+    namespace = {f"_hook_{index}": hook for index, hook in enumerate(hooks)}
+    body = "\n".join(f"    _hook_{index}(interpreter)" for index in range(len(hooks)))
+    source = f"def _dispatch(interpreter):\n{body or '    pass'}\n"
+    exec(compile(source, "<sapl-plugin-dispatcher>", "exec"), namespace)
+    return namespace["_dispatch"]
+
+
+compile_dispatcher.cache_clear = _compile_dispatcher.cache_clear  # type: ignore[attr-defined]
+
+
+# Name fallbacks for callables that reject attribute assignment in
+# _wrap_plugin (e.g. C callables); keyed weakly so hooks can be collected.
+_NAME_CACHE: "WeakKeyDictionary[PluginHook, str]" = WeakKeyDictionary()
 
 
 def plugin_name(hook: PluginHook) -> str:
     """Return a human-readable name for *hook*."""
 
-    return getattr(hook, "__sapl_plugin_name__", getattr(hook, "__name__", "plugin"))
+    name = getattr(hook, "__sapl_plugin_name__", None)
+    if name is not None:
+        return name
+    name = _NAME_CACHE.get(hook)
+    if name is None:
+        name = getattr(hook, "__name__", "plugin")
+        try:
+            _NAME_CACHE[hook] = name
+        except TypeError:
+            pass
+    return name
 
 
-__all__ = [
+__all__ = (
     "PluginError",
     "PluginHook",
+    "clear_plugin_cache",
+    "compile_dispatcher",
     "load_plugin",
     "load_plugins",
     "load_plugins_from_directory",
     "plugin_name",
-]
+)
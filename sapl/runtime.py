@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import operator
+import string
 from contextlib import ExitStack, contextmanager
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 
 from pathlib import Path
@@ -17,9 +19,10 @@ from . import stdlib
 from .lexer import lex
 from .module_loader import ModuleLoader, ModuleSpec
 from .parser import parse
+from .plugins import compile_dispatcher, plugin_name
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """Represents an actionable step in a plan."""
 
@@ -29,7 +32,7 @@ class Action:
     line: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A collection of related actions under a named activity."""
 
@@ -39,7 +42,7 @@ class Task:
     steps: List[Action] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """Structured representation of a potential security finding."""
 
@@ -62,18 +65,75 @@ class ExecutionResult:
     findings: List[Finding]
     report_destination: Optional[str]
 
+    def actions_by_kind(self, kind: str) -> List[Action]:
+        """Return the standalone actions whose kind equals *kind*."""
 
-class _BreakSignal(Exception):
-    pass
+        actions = self.standalone_actions
+        kinds = getattr(self, "_standalone_kinds", None)
+        if kinds is None or len(kinds) != len(actions):
+            return [action for action in actions if action.kind == kind]
+        # The parallel kind column (kept in lockstep by the context) lets the
+        # filter scan a flat list of strings instead of touching an attribute
+        # on every Action object.
+        return [actions[index] for index, value in enumerate(kinds) if value == kind]
 
+    def detached(self) -> "ExecutionResult":
+        """Return a snapshot that no longer aliases interpreter state."""
 
-class _ContinueSignal(Exception):
-    pass
+        return ExecutionResult(
+            targets=list(self.targets),
+            scope=list(self.scope),
+            variables=dict(self.variables),
+            payloads={key: list(values) for key, values in self.payloads.items()},
+            tasks=list(self.tasks),
+            standalone_actions=list(self.standalone_actions),
+            notes=list(self.notes),
+            findings=list(self.findings),
+            report_destination=self.report_destination,
+        )
 
 
-class _ReturnSignal(Exception):
-    def __init__(self, value: Any) -> None:
-        self.value = value
+# Control-flow flags returned by statement handlers.  A falsy return means
+# normal fall-through; loops and function calls inspect the flag instead of
+# paying exception-machinery cost for every BREAK/CONTINUE/RETURN.
+_FLOW_BREAK = 1
+_FLOW_CONTINUE = 2
+_FLOW_RETURN = 3
+
+# Sentinel distinguishing "no default" from an explicit None default.
+_MISSING = object()
+
+# Binary operators resolved once to C-level callables; a dict hit replaces
+# the former chain of string comparisons walked per operation.
+_BINARY_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "PLUS": operator.add,
+    "MINUS": operator.sub,
+    "STAR": operator.mul,
+    "SLASH": operator.truediv,
+    "DBLSLASH": operator.floordiv,
+    "PERCENT": operator.mod,
+    "POWER": operator.pow,
+    "EQ": operator.eq,
+    "NEQ": operator.ne,
+    "LT": operator.lt,
+    "LTE": operator.le,
+    "GT": operator.gt,
+    "GTE": operator.ge,
+    "AND": lambda left, right: bool(left) and bool(right),
+    "OR": lambda left, right: bool(left) or bool(right),
+    # operator.contains takes the container first; keep SAPL's operand order.
+    "IN": lambda left, right: left in right,
+}
+
+_AUGMENTED_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "PLUSEQ": operator.add,
+    "MINUSEQ": operator.sub,
+    "STAREQ": operator.mul,
+    "SLASHEQ": operator.truediv,
+    "DBLSLASHEQ": operator.floordiv,
+    "PERCENTEQ": operator.mod,
+    "POWEQ": operator.pow,
+}
 
 
 @dataclass
@@ -89,11 +149,17 @@ class ExecutionContext:
         self.payloads: Dict[str, List[str]] = {}
         self.tasks: List[Task] = []
         self.standalone_actions: List[Action] = []
+        # Kind of each standalone action, appended in lockstep; lets result
+        # filters scan strings instead of dereferencing Action objects.
+        self._standalone_kinds: List[str] = []
         self.notes: List[str] = []
         self.findings: List[Finding] = []
         self.report_destination: Optional[str] = None
         self._task_stack: List[Task] = []
         self.builtins: Dict[str, Any] = stdlib.load_builtins()
+        self._context_version = 0
+        self._rendered: Optional[Dict[str, Any]] = None
+        self._rendered_version = -1
 
     @property
     def current_task(self) -> Optional[Task]:
@@ -118,12 +184,22 @@ class ExecutionContext:
         self.frames.pop()
 
     def add_action(self, action: Action) -> None:
-        if self.current_task is not None:
-            self.current_task.steps.append(action)
+        task_stack = self._task_stack
+        if task_stack:
+            task_stack[-1].steps.append(action)
         else:
             self.standalone_actions.append(action)
+            self._standalone_kinds.append(action.kind)
+
+    def touch(self) -> None:
+        """Record a name-binding change, invalidating the rendered context."""
+
+        self._context_version += 1
 
     def format_context(self) -> Dict[str, Any]:
+        # Rebuilt only after touch(); callers treat the result as read-only.
+        if self._rendered is not None and self._rendered_version == self._context_version:
+            return self._rendered
         rendered: Dict[str, Any] = {}
         for name, value in self.variables.items():
             if callable(value):
@@ -135,6 +211,8 @@ class ExecutionContext:
             rendered.setdefault("target", self.targets[0])
         for name, values in self.payloads.items():
             rendered.setdefault(f"payload_{name}", values)
+        self._rendered = rendered
+        self._rendered_version = self._context_version
         return rendered
 
 
@@ -164,14 +242,14 @@ class SAPLFunction:
         self.is_async = is_async
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        return self.interpreter._invoke_function(self, list(args), dict(kwargs))
+        return self.interpreter._invoke_function(self, args, kwargs)
 
     def bind_to_class(self) -> Any:
         def method(instance: Any, *args: Any, **kwargs: Any) -> Any:
             return self.interpreter._invoke_function(
                 self,
-                list(args),
-                dict(kwargs),
+                args,
+                kwargs,
                 bound_instance=instance,
             )
 
@@ -181,21 +259,21 @@ class SAPLFunction:
         return method
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingAsyncCall:
     """Deferred invocation for asynchronous SAPL functions."""
 
     interpreter: "Interpreter"
     function: SAPLFunction
-    args: List[Any]
+    args: Sequence[Any]
     kwargs: Dict[str, Any]
     bound_instance: Any | None = None
 
     def resolve(self) -> Any:
         return self.interpreter._call_function(
             self.function,
-            list(self.args),
-            dict(self.kwargs),
+            self.args,
+            self.kwargs,
             bound_instance=self.bound_instance,
             asynchronous=True,
         )
@@ -204,6 +282,17 @@ class PendingAsyncCall:
 class SAPLLambda:
     """Callable representing a lambda expression."""
 
+    __slots__ = (
+        "interpreter",
+        "parameters",
+        "body",
+        "defaults",
+        "closure",
+        "line",
+        "_param_names",
+        "_param_defaults",
+    )
+
     def __init__(
         self,
         interpreter: "Interpreter",
@@ -219,31 +308,53 @@ class SAPLLambda:
         self.defaults = defaults
         self.closure = closure
         self.line = line
+        # Indexed views of the parameter list so binding avoids per-call
+        # dict probes and O(n) pop(0) shifting.
+        self._param_names = tuple(param.name for param in parameters)
+        self._param_defaults = tuple(defaults.get(name, _MISSING) for name in self._param_names)
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        frame = dict(self.closure)
-        remaining_args = list(args)
-        remaining_kwargs = dict(kwargs)
-        for param in self.parameters:
-            if remaining_args:
-                frame[param.name] = remaining_args.pop(0)
-            elif param.name in remaining_kwargs:
-                frame[param.name] = remaining_kwargs.pop(param.name)
-            elif param.name in self.defaults:
-                frame[param.name] = self.defaults[param.name]
+        # Parameters get their own small frame stacked on top of the closure,
+        # so invocation cost is O(#params) instead of copying the closure.
+        names = self._param_names
+        param_defaults = self._param_defaults
+        arg_count = len(args)
+        matched_kwargs = 0
+        frame: Dict[str, Any] = {}
+        for index, name in enumerate(names):
+            if index < arg_count:
+                frame[name] = args[index]
+            elif name in kwargs:
+                frame[name] = kwargs[name]
+                matched_kwargs += 1
             else:
-                raise RuntimeError(
-                    f"Missing value for parameter '{param.name}' in lambda defined on line {self.line}"
-                )
-        if remaining_args or remaining_kwargs:
+                default = param_defaults[index]
+                if default is _MISSING:
+                    raise RuntimeError(
+                        f"Missing value for parameter '{name}' in lambda defined on line {self.line}"
+                    )
+                frame[name] = default
+        if arg_count > len(names) or matched_kwargs != len(kwargs):
             raise RuntimeError(
                 f"Too many arguments supplied to lambda defined on line {self.line}"
             )
-        self.interpreter.context.push_frame(frame)
+        context = self.interpreter.context
+        context.push_frame(self.closure)
+        context.push_frame(frame)
         try:
             return self.interpreter._evaluate_expression(self.body, self.line)
         finally:
-            self.interpreter.context.pop_frame()
+            context.pop_frame()
+            context.pop_frame()
+
+# With fewer hooks than this, generating a dispatcher costs more than the loop.
+_DISPATCHER_THRESHOLD = 8
+
+# Parsed custom-module sources keyed by (resolved path, mtime_ns).  Programs
+# are re-executed per interpreter so module state stays isolated, but the
+# read+lex+parse cost for a given file is paid once per process.
+_PROGRAM_CACHE: Dict[tuple, nodes.Program] = {}
+
 
 class Interpreter:
     """Executes SAPL programs and returns a structured plan."""
@@ -256,28 +367,55 @@ class Interpreter:
     ) -> None:
         self.context = ExecutionContext()
         self._function_stack: List[SAPLFunction] = []
+        self._block_cache: Dict[int, Any] = {}
+        self._stmt_meta: Dict[int, Any] = {}
+        self._star_import_cache: Dict[int, Any] = {}
+        self._return_value: Any = None
+        # Recycled call frames; _call_function pops one instead of allocating
+        # a dict per invocation.  Depth is bounded by the deepest recursion.
+        self._frame_pool: List[Dict[str, Any]] = []
+        # Event loop created on first AWAIT and reused for the interpreter's
+        # lifetime; per-await loop setup/teardown costs milliseconds.
+        self._loop: asyncio.AbstractEventLoop | None = None
         if module_loader is None:
             module_loader = ModuleLoader([Path.cwd()])
         self.module_loader = module_loader
         self._applied_plugins: List[str] = []
         if plugins:
-            for plugin in plugins:
-                self.register_plugin(plugin)
+            hooks = tuple(plugins)
+            if len(hooks) >= _DISPATCHER_THRESHOLD:
+                # A code-generated dispatcher turns the per-hook loop into a
+                # straight-line call sequence; memoised on the hook tuple,
+                # so the codegen cost amortises across interpreters that
+                # share one plugin set (the common server case).
+                compile_dispatcher(hooks)(self)
+                self._applied_plugins.extend(str(plugin_name(hook)) for hook in hooks)
+            else:
+                for plugin in hooks:
+                    self.register_plugin(plugin)
 
     def execute(self, program: nodes.Program) -> ExecutionResult:
-        for statement in program.statements:
-            self._execute_statement(statement)
-        return ExecutionResult(
-            targets=list(self.context.targets),
-            scope=list(self.context.scope),
+        self._execute_block(program.statements)
+        context = self.context
+        # The result shares the live context containers instead of copying
+        # them, which would double peak memory for action-heavy programs the
+        # moment they finish.  Callers that keep executing on the same
+        # interpreter and need an isolated snapshot call detached().
+        result = ExecutionResult(
+            targets=context.targets,
+            scope=context.scope,
             variables=self._snapshot_variables(),
-            payloads={key: list(value) for key, value in self.context.payloads.items()},
-            tasks=list(self.context.tasks),
-            standalone_actions=list(self.context.standalone_actions),
-            notes=list(self.context.notes),
-            findings=list(self.context.findings),
-            report_destination=self.context.report_destination,
+            payloads=context.payloads,
+            tasks=context.tasks,
+            standalone_actions=context.standalone_actions,
+            notes=context.notes,
+            findings=context.findings,
+            report_destination=context.report_destination,
         )
+        # Non-field attribute: keeps asdict()/JSON output unchanged while
+        # actions_by_kind gets its flat kind column.
+        result._standalone_kinds = context._standalone_kinds
+        return result
 
     def register_builtin(self, name: str, value: Any) -> None:
         """Expose *value* to SAPL programs under *name*."""
@@ -297,247 +435,362 @@ class Interpreter:
 
         return list(self._applied_plugins)
 
+    def close(self) -> None:
+        """Release resources owned by the interpreter."""
+
+        loop = self._loop
+        if loop is not None:
+            loop.close()
+            self._loop = None
+
     # Statement execution ----------------------------------------------
 
-    def _execute_statement(self, statement: nodes.Statement) -> None:
-        if isinstance(statement, nodes.SetStatement):
-            value = self._evaluate_expression(statement.value, statement.line)
-            self.context.variables[statement.name] = value
-            self.context.frames[0][statement.name] = value
-            return
-        if isinstance(statement, nodes.TargetStatement):
-            for value in self._coerce_iterable(statement.value, statement.line):
-                self.context.targets.append(str(value))
-            return
-        if isinstance(statement, nodes.ScopeStatement):
-            values = self._coerce_iterable(statement.value, statement.line)
-            self.context.scope.extend(str(item) for item in values)
-            return
-        if isinstance(statement, nodes.PayloadStatement):
-            payload_values = [str(item) for item in self._coerce_iterable(statement.value, statement.line)]
-            self.context.payloads[statement.name] = payload_values
-            return
-        if isinstance(statement, nodes.TaskStatement):
-            task_name = self._interpolate(statement.name)
-            task = Task(task_name, statement.line, docstring=statement.docstring)
-            self.context.tasks.append(task)
-            with self.context.push_task(task):
-                self._execute_block(statement.body)
-            return
-        if isinstance(statement, nodes.PortScanStatement):
-            ports = [str(item) for item in self._coerce_iterable(statement.ports, statement.line)]
-            tool = self._evaluate_string(statement.tool, statement.line) if statement.tool else None
-            summary = f"Port scan ports {', '.join(ports)}"
-            action = Action(
-                kind="portscan",
-                summary=summary,
-                details={"ports": ports, "tool": tool},
-                line=statement.line,
-            )
-            self.context.add_action(action)
-            return
-        if isinstance(statement, nodes.HttpRequestStatement):
-            target = self._evaluate_string(statement.target, statement.line)
-            summary = f"HTTP {statement.method} {target}"
-            details = {
-                "method": statement.method,
-                "target": target,
-            }
-            if statement.expect_status is not None:
-                details["expect_status"] = statement.expect_status
-            if statement.contains is not None:
-                details["contains"] = self._evaluate_string(statement.contains, statement.line)
-            action = Action(kind="http", summary=summary, details=details, line=statement.line)
-            self.context.add_action(action)
-            return
-        if isinstance(statement, nodes.FuzzStatement):
-            resource = self._evaluate_string(statement.resource, statement.line)
-            method = statement.method or "GET"
-            payloads: List[str] = []
-            if statement.payload is not None:
-                if statement.payload not in self.context.payloads:
-                    raise RuntimeError(f"Unknown payload: {statement.payload}")
-                payloads.extend(self.context.payloads[statement.payload])
-            if statement.payloads_expr is not None:
-                payloads.extend(str(item) for item in self._coerce_iterable(statement.payloads_expr, statement.line))
-            action = Action(
-                kind="fuzz",
-                summary=f"Fuzz {resource} using {len(payloads) or 'custom'} payloads",
-                details={"resource": resource, "method": method, "payloads": payloads},
-                line=statement.line,
-            )
-            self.context.add_action(action)
-            return
-        if isinstance(statement, nodes.NoteStatement):
-            message = self._evaluate_string(statement.message, statement.line)
-            self.context.notes.append(message)
-            return
-        if isinstance(statement, nodes.FindingStatement):
-            message = self._evaluate_string(statement.message, statement.line)
-            finding = Finding(statement.severity, message, statement.line)
-            self.context.findings.append(finding)
-            return
-        if isinstance(statement, nodes.RunStatement):
-            command = self._evaluate_string(statement.command, statement.line)
-            details = {"command": command}
-            if statement.save_as:
-                details["save_as"] = statement.save_as
-            action = Action(kind="run", summary=f"Run command: {command}", details=details, line=statement.line)
-            self.context.add_action(action)
-            return
-        if isinstance(statement, nodes.ReportStatement):
-            destination = self._evaluate_string(statement.destination, statement.line)
-            self.context.report_destination = destination
-            return
-        if isinstance(statement, nodes.InputStatement):
-            input_fn = self.context.builtins.get("input")
-            if input_fn is None:
-                raise RuntimeError("INPUT statements require the 'input' builtin")
-            prompt = ""
-            if statement.prompt is not None:
-                prompt_value = self._evaluate_expression(statement.prompt, statement.line)
-                if isinstance(prompt_value, str):
-                    prompt = self._interpolate(prompt_value)
-                else:
-                    prompt = str(prompt_value)
-            value = input_fn(prompt)
-            if statement.target is not None:
-                self._assign(statement.target, value, statement.line)
-            summary = f"Input {statement.target or 'value'}"
-            details = {"prompt": prompt, "value": value}
-            self.context.add_action(Action(kind="input", summary=summary, details=details, line=statement.line))
-            return
-        if isinstance(statement, nodes.OutputStatement):
-            output_fn = self.context.builtins.get("print")
-            if output_fn is None:
-                raise RuntimeError("OUTPUT statements require the 'print' builtin")
-            rendered = self._evaluate_expression(statement.value, statement.line)
-            if isinstance(rendered, str):
-                rendered = self._interpolate(rendered)
-            output_fn(rendered)
-            summary = f"Output {rendered}"
-            details = {"value": rendered}
-            self.context.add_action(Action(kind="output", summary=summary, details=details, line=statement.line))
-            return
-        if isinstance(statement, nodes.ForStatement):
-            iterable = self._evaluate_expression(statement.iterable, statement.line)
-            previous_value = self._lookup_variable(statement.iterator)
-            sentinel = object()
-            if previous_value is None:
-                previous_value = sentinel
-            try:
-                for item in self._iterable(iterable, statement.line):
-                    self._assign(statement.iterator, item, statement.line)
-                    try:
-                        self._execute_block(statement.body)
-                    except _ContinueSignal:
-                        continue
-            except _BreakSignal:
-                pass
-            finally:
-                if previous_value is sentinel:
-                    self._delete(statement.iterator)
-                else:
-                    self._assign(statement.iterator, previous_value, statement.line)
+    def _execute_statement(self, statement: nodes.Statement) -> Optional[int]:
+        handler = _STATEMENT_HANDLERS.get(type(statement))
+        if handler is None:
+            raise RuntimeError(f"Unsupported statement type: {type(statement)!r}")
+        return handler(self, statement)
+
+    def _exec_set(self, statement: nodes.SetStatement) -> None:
+        value = self._evaluate_expression(statement.value, statement.line)
+        self.context.variables[statement.name] = value
+        self.context.touch()
+
+    def _exec_target(self, statement: nodes.TargetStatement) -> None:
+        for value in self._coerce_iterable(statement.value, statement.line):
+            self.context.targets.append(str(value))
+        self.context.touch()
+
+    def _exec_scope(self, statement: nodes.ScopeStatement) -> None:
+        values = self._coerce_iterable(statement.value, statement.line)
+        self.context.scope.extend(map(str, values))
+        self.context.touch()
+
+    def _exec_payload(self, statement: nodes.PayloadStatement) -> None:
+        payload_values = list(map(str, self._coerce_iterable(statement.value, statement.line)))
+        self.context.payloads[statement.name] = payload_values
+        self.context.touch()
+
+    def _exec_task(self, statement: nodes.TaskStatement) -> Optional[int]:
+        task_name = self._interpolate(statement.name)
+        task = Task(task_name, statement.line, docstring=statement.docstring)
+        self.context.tasks.append(task)
+        with self.context.push_task(task):
+            return self._execute_block(statement.body)
+
+    def _exec_portscan(self, statement: nodes.PortScanStatement) -> None:
+        ports = list(map(str, self._coerce_iterable(statement.ports, statement.line)))
+        tool = self._evaluate_string(statement.tool, statement.line) if statement.tool else None
+        summary = f"Port scan ports {', '.join(ports)}"
+        action = Action(
+            kind="portscan",
+            summary=summary,
+            details={"ports": ports, "tool": tool},
+            line=statement.line,
+        )
+        self.context.add_action(action)
+
+    def _exec_http(self, statement: nodes.HttpRequestStatement) -> None:
+        # Statements whose strings are literals with no placeholders always
+        # produce the same Action; build it once and append by reference.
+        # Consumers treat Actions as immutable, so sharing is safe.
+        meta = self._stmt_meta.get(id(statement))
+        if meta is None or meta[0] is not statement:
+            prototype = None
+            if _static_string(statement.target) and (
+                statement.contains is None or _static_string(statement.contains)
+            ):
+                details = {"method": statement.method, "target": statement.target}
+                if statement.expect_status is not None:
+                    details["expect_status"] = statement.expect_status
+                if statement.contains is not None:
+                    details["contains"] = statement.contains
+                prototype = Action(
+                    kind="http",
+                    summary=f"HTTP {statement.method} {statement.target}",
+                    details=details,
+                    line=statement.line,
+                )
+            meta = (statement, prototype)
+            self._stmt_meta[id(statement)] = meta
+        if meta[1] is not None:
+            self.context.add_action(meta[1])
             return
-        if isinstance(statement, nodes.IfStatement):
-            if self._truthy(self._evaluate_expression(statement.condition, statement.line)):
-                self._execute_block(statement.body)
-            else:
-                handled = False
-                for expr, body in statement.elif_blocks:
-                    if self._truthy(self._evaluate_expression(expr, statement.line)):
-                        self._execute_block(body)
-                        handled = True
-                        break
-                if not handled and statement.else_body:
-                    self._execute_block(statement.else_body)
+        target = self._evaluate_string(statement.target, statement.line)
+        summary = f"HTTP {statement.method} {target}"
+        details = {
+            "method": statement.method,
+            "target": target,
+        }
+        if statement.expect_status is not None:
+            details["expect_status"] = statement.expect_status
+        if statement.contains is not None:
+            details["contains"] = self._evaluate_string(statement.contains, statement.line)
+        action = Action(kind="http", summary=summary, details=details, line=statement.line)
+        self.context.add_action(action)
+
+    def _exec_fuzz(self, statement: nodes.FuzzStatement) -> None:
+        resource = self._evaluate_string(statement.resource, statement.line)
+        method = statement.method or "GET"
+        payloads: List[str] = []
+        if statement.payload is not None:
+            if statement.payload not in self.context.payloads:
+                raise RuntimeError(f"Unknown payload: {statement.payload}")
+            payloads.extend(self.context.payloads[statement.payload])
+        if statement.payloads_expr is not None:
+            payloads.extend(map(str, self._coerce_iterable(statement.payloads_expr, statement.line)))
+        action = Action(
+            kind="fuzz",
+            summary=f"Fuzz {resource} using {len(payloads) or 'custom'} payloads",
+            details={"resource": resource, "method": method, "payloads": payloads},
+            line=statement.line,
+        )
+        self.context.add_action(action)
+
+    def _exec_note(self, statement: nodes.NoteStatement) -> None:
+        message = self._evaluate_string(statement.message, statement.line)
+        self.context.notes.append(message)
+
+    def _exec_finding(self, statement: nodes.FindingStatement) -> None:
+        message = self._evaluate_string(statement.message, statement.line)
+        finding = Finding(statement.severity, message, statement.line)
+        self.context.findings.append(finding)
+
+    def _exec_run(self, statement: nodes.RunStatement) -> None:
+        meta = self._stmt_meta.get(id(statement))
+        if meta is None or meta[0] is not statement:
+            prototype = None
+            if _static_string(statement.command):
+                details = {"command": statement.command}
+                if statement.save_as:
+                    details["save_as"] = statement.save_as
+                prototype = Action(
+                    kind="run",
+                    summary=f"Run command: {statement.command}",
+                    details=details,
+                    line=statement.line,
+                )
+            meta = (statement, prototype)
+            self._stmt_meta[id(statement)] = meta
+        if meta[1] is not None:
+            self.context.add_action(meta[1])
             return
-        if isinstance(statement, nodes.WhileStatement):
-            try:
-                while self._truthy(self._evaluate_expression(statement.condition, statement.line)):
-                    try:
-                        self._execute_block(statement.body)
-                    except _ContinueSignal:
-                        continue
-            except _BreakSignal:
-                pass
+        command = self._evaluate_string(statement.command, statement.line)
+        details = {"command": command}
+        if statement.save_as:
+            details["save_as"] = statement.save_as
+        action = Action(kind="run", summary=f"Run command: {command}", details=details, line=statement.line)
+        self.context.add_action(action)
+
+    def _exec_report(self, statement: nodes.ReportStatement) -> None:
+        destination = self._evaluate_string(statement.destination, statement.line)
+        self.context.report_destination = destination
+
+    def _exec_input(self, statement: nodes.InputStatement) -> None:
+        # The builtins dict is a public override point (embedders and tests
+        # swap entries in directly), so the lookup cannot be hoisted to
+        # __init__; the try/except keeps the found path to a single probe.
+        try:
+            input_fn = self.context.builtins["input"]
+        except KeyError:
+            raise RuntimeError("INPUT statements require the 'input' builtin") from None
+        prompt = ""
+        if statement.prompt is not None:
+            prompt_value = self._evaluate_expression(statement.prompt, statement.line)
+            if isinstance(prompt_value, str):
+                prompt = self._interpolate(prompt_value)
             else:
-                if statement.else_body:
-                    self._execute_block(statement.else_body)
-            return
-        if isinstance(statement, nodes.BreakStatement):
-            raise _BreakSignal()
-        if isinstance(statement, nodes.ContinueStatement):
-            raise _ContinueSignal()
-        if isinstance(statement, nodes.PassStatement):
-            return
-        if isinstance(statement, nodes.ReturnStatement):
-            if not self._function_stack:
-                raise RuntimeError("RETURN used outside of a function")
-            value = self._evaluate_expression(statement.value, statement.line) if statement.value is not None else None
-            raise _ReturnSignal(value)
-        if isinstance(statement, nodes.FunctionDefinition):
-            defaults = {}
-            for param in statement.parameters:
-                if param.default is not None:
-                    defaults[param.name] = self._evaluate_expression(param.default, statement.line)
-            closure: Dict[str, Any] = {}
-            for frame in self.context.frames:
-                closure.update(frame)
-            function = SAPLFunction(
-                self,
-                statement.name,
-                statement.parameters,
-                statement.body,
-                defaults,
-                closure,
-                statement.docstring,
-                is_async=statement.is_async,
-            )
-            target_frame = self.context.frames[-1]
-            target_frame[statement.name] = function
-            if target_frame is self.context.frames[0]:
-                self.context.variables[statement.name] = function
-            return
-        if isinstance(statement, nodes.ExpressionStatement):
-            self._evaluate_expression(statement.expression, statement.line)
-            return
-        if isinstance(statement, nodes.AssignmentStatement):
-            value = self._evaluate_expression(statement.value, statement.line)
-            targets = [self._materialise_target(target, statement.line) for target in statement.targets]
-            if len(targets) == 1:
-                self._assign_target(targets[0], value, statement.line)
+                prompt = str(prompt_value)
+        value = input_fn(prompt)
+        if statement.target is not None:
+            self._assign(statement.target, value, statement.line)
+        summary = f"Input {statement.target or 'value'}"
+        details = {"prompt": prompt, "value": value}
+        self.context.add_action(Action(kind="input", summary=summary, details=details, line=statement.line))
+
+    def _exec_output(self, statement: nodes.OutputStatement) -> None:
+        try:
+            output_fn = self.context.builtins["print"]
+        except KeyError:
+            raise RuntimeError("OUTPUT statements require the 'print' builtin") from None
+        rendered = self._evaluate_expression(statement.value, statement.line)
+        if isinstance(rendered, str):
+            rendered = self._interpolate(rendered)
+        output_fn(rendered)
+        summary = f"Output {rendered}"
+        details = {"value": rendered}
+        self.context.add_action(Action(kind="output", summary=summary, details=details, line=statement.line))
+
+    def _exec_for(self, statement: nodes.ForStatement) -> Optional[int]:
+        iterable = self._evaluate_expression(statement.iterable, statement.line)
+        # Lists, tuples and ranges dominate SAPL loops; they can be iterated
+        # directly without the generic _iterable coercion.
+        if not isinstance(iterable, (list, tuple, range)):
+            iterable = self._iterable(iterable, statement.line)
+        # The loop binds the iterator in the innermost frame, so only that
+        # frame needs saving: one probe with the _MISSING sentinel replaces
+        # the full frame scan and per-execution sentinel allocation.
+        name = statement.iterator
+        context = self.context
+        frame = context.frames[-1]
+        touch = context.touch
+        execute_block = self._execute_block
+        body = statement.body
+        previous_value = frame.get(name, _MISSING)
+        result = None
+        try:
+            for item in iterable:
+                frame[name] = item
+                touch()
+                flow = execute_block(body)
+                if flow and flow != _FLOW_CONTINUE:
+                    if flow == _FLOW_RETURN:
+                        result = flow
+                    break
+        finally:
+            if previous_value is _MISSING:
+                frame.pop(name, None)
             else:
-                values = list(self._iterable(value, statement.line))
-                if len(values) != len(targets):
-                    raise RuntimeError("Mismatched assignment value count")
-                for target, individual in zip(targets, values):
-                    self._assign_target(target, individual, statement.line)
-            return
-        if isinstance(statement, nodes.AugmentedAssignmentStatement):
-            target = self._materialise_target(statement.target, statement.line)
-            current = self._read_target(target, statement.line)
-            increment = self._evaluate_expression(statement.value, statement.line)
-            result = self._apply_augmented(statement.operator, current, increment, statement.line)
-            self._assign_target(target, result, statement.line)
-            return
-        if isinstance(statement, nodes.WithStatement):
-            with ExitStack() as stack:
-                self.context.push_frame({})
-                try:
-                    for item in statement.items:
-                        manager = self._evaluate_expression(item.context, statement.line)
-                        entered = stack.enter_context(manager)
-                        if item.alias:
-                            self._assign(item.alias, entered, statement.line)
-                    self._execute_block(statement.body)
-                finally:
-                    self.context.pop_frame()
-            return
-        if isinstance(statement, nodes.TryStatement):
+                frame[name] = previous_value
+            touch()
+        return result
+
+    def _exec_if(self, statement: nodes.IfStatement) -> Optional[int]:
+        # The IF condition and elif conditions form one flattened chain,
+        # precomputed per statement so repeated executions walk a flat list.
+        meta = self._stmt_meta.get(id(statement))
+        if meta is None or meta[0] is not statement:
+            chain = [(statement.condition, statement.body)]
+            chain.extend(statement.elif_blocks)
+            meta = (statement, chain)
+            self._stmt_meta[id(statement)] = meta
+        line = statement.line
+        evaluate = self._evaluate_expression
+        for condition, body in meta[1]:
+            if evaluate(condition, line):
+                return self._execute_block(body)
+        if statement.else_body:
+            return self._execute_block(statement.else_body)
+        return None
+
+    def _exec_while(self, statement: nodes.WhileStatement) -> Optional[int]:
+        evaluate = self._evaluate_expression
+        execute_block = self._execute_block
+        condition = statement.condition
+        body = statement.body
+        line = statement.line
+        while evaluate(condition, line):
+            flow = execute_block(body)
+            if flow and flow != _FLOW_CONTINUE:
+                if flow == _FLOW_RETURN:
+                    return flow
+                break
+        else:
+            if statement.else_body:
+                return self._execute_block(statement.else_body)
+        return None
+
+    def _exec_break(self, statement: nodes.BreakStatement) -> int:
+        return _FLOW_BREAK
+
+    def _exec_continue(self, statement: nodes.ContinueStatement) -> int:
+        return _FLOW_CONTINUE
+
+    def _exec_pass(self, statement: nodes.PassStatement) -> None:
+        return
+
+    def _exec_return(self, statement: nodes.ReturnStatement) -> int:
+        if not self._function_stack:
+            raise RuntimeError("RETURN used outside of a function")
+        value = self._evaluate_expression(statement.value, statement.line) if statement.value is not None else None
+        self._return_value = value
+        return _FLOW_RETURN
+
+    def _exec_function_def(self, statement: nodes.FunctionDefinition) -> None:
+        defaults = {}
+        for param in statement.parameters:
+            if param.default is not None:
+                defaults[param.name] = self._evaluate_expression(param.default, statement.line)
+        closure = self._capture_closure(statement, statement.body, statement.parameters)
+        function = SAPLFunction(
+            self,
+            statement.name,
+            statement.parameters,
+            statement.body,
+            defaults,
+            closure,
+            statement.docstring,
+            is_async=statement.is_async,
+        )
+        self.context.frames[-1][statement.name] = function
+        self.context.touch()
+
+    def _capture_closure(
+        self,
+        node: Any,
+        body: Any,
+        parameters: List[nodes.Parameter],
+    ) -> Dict[str, Any]:
+        # Capture only the free variables the body actually references,
+        # rather than snapshotting the union of every live frame.  The free
+        # set is memoized per definition node, so closures created inside
+        # loops pay O(#free names) per iteration.
+        meta = self._stmt_meta.get(id(node))
+        if meta is None or meta[0] is not node:
+            free: set = set()
+            _collect_identifiers(body, free)
+            free.difference_update(param.name for param in parameters)
+            meta = (node, tuple(free))
+            self._stmt_meta[id(node)] = meta
+        closure: Dict[str, Any] = {}
+        frames = self.context.frames
+        for name in meta[1]:
+            for frame in reversed(frames):
+                if name in frame:
+                    closure[name] = frame[name]
+                    break
+        return closure
+
+    def _exec_expression(self, statement: nodes.ExpressionStatement) -> None:
+        self._evaluate_expression(statement.expression, statement.line)
+
+    def _exec_assignment(self, statement: nodes.AssignmentStatement) -> None:
+        value = self._evaluate_expression(statement.value, statement.line)
+        targets = [self._materialise_target(target, statement.line) for target in statement.targets]
+        if len(targets) == 1:
+            self._assign_target(targets[0], value, statement.line)
+        else:
+            values = list(self._iterable(value, statement.line))
+            if len(values) != len(targets):
+                raise RuntimeError("Mismatched assignment value count")
+            for target, individual in zip(targets, values):
+                self._assign_target(target, individual, statement.line)
+
+    def _exec_augmented_assignment(self, statement: nodes.AugmentedAssignmentStatement) -> None:
+        target = self._materialise_target(statement.target, statement.line)
+        current = self._read_target(target, statement.line)
+        increment = self._evaluate_expression(statement.value, statement.line)
+        result = self._apply_augmented(statement.operator, current, increment, statement.line)
+        self._assign_target(target, result, statement.line)
+
+    def _exec_with(self, statement: nodes.WithStatement) -> Optional[int]:
+        with ExitStack() as stack:
+            self.context.push_frame({})
+            try:
+                for item in statement.items:
+                    manager = self._evaluate_expression(item.context, statement.line)
+                    entered = stack.enter_context(manager)
+                    if item.alias:
+                        self._assign(item.alias, entered, statement.line)
+                return self._execute_block(statement.body)
+            finally:
+                self.context.pop_frame()
+
+    def _exec_try(self, statement: nodes.TryStatement) -> Optional[int]:
+        flow = None
+        try:
             try:
-                self._execute_block(statement.body)
+                flow = self._execute_block(statement.body)
             except Exception as exc:  # pylint: disable=broad-except
                 handled = False
                 for handler in statement.handlers:
@@ -550,7 +803,7 @@ class Interpreter:
                     try:
                         if handler.alias:
                             self._assign(handler.alias, exc, statement.line)
-                        self._execute_block(handler.body)
+                        flow = self._execute_block(handler.body)
                     finally:
                         self.context.pop_frame()
                     handled = True
@@ -558,73 +811,87 @@ class Interpreter:
                 if not handled:
                     raise
             else:
-                if statement.else_body:
-                    self._execute_block(statement.else_body)
-            finally:
-                if statement.finally_body:
-                    self._execute_block(statement.finally_body)
-            return
-        if isinstance(statement, nodes.RaiseStatement):
-            if statement.value is None:
-                raise RuntimeError("RAISE requires an exception value")
-            value = self._evaluate_expression(statement.value, statement.line)
-            if isinstance(value, BaseException):
-                raise value
-            raise RuntimeError(f"Cannot raise value of type {type(value).__name__}")
-        if isinstance(statement, nodes.ImportStatement):
-            for item in statement.items:
-                module = self._import_module(item.module)
-                alias = item.alias or item.module[-1]
-                self.context.variables[alias] = module
-                self.context.frames[0][alias] = module
-                self.context.modules[alias] = module
-            return
-        if isinstance(statement, nodes.FromImportStatement):
-            module = self._import_module(statement.module)
-            for item in statement.items:
-                if item.name == "*":
-                    for attr in stdlib.module_public_names(module):
-                        value = getattr(module, attr)
-                        self.context.variables[attr] = value
-                        self.context.frames[0][attr] = value
-                    continue
-                if not hasattr(module, item.name):
-                    raise RuntimeError(f"Module '{'.'.join(statement.module)}' has no attribute '{item.name}'")
-                alias = item.alias or item.name
-                value = getattr(module, item.name)
-                self.context.variables[alias] = value
-                self.context.frames[0][alias] = value
-            return
-        if isinstance(statement, nodes.ClassDefinition):
-            bases = [self._evaluate_expression(expr, statement.line) for expr in statement.bases]
-            if not bases:
-                bases = [object]
-            class_namespace: Dict[str, Any] = {}
-            self.context.push_frame(class_namespace)
-            try:
-                self._execute_block(statement.body)
-            finally:
-                self.context.pop_frame()
-            attrs: Dict[str, Any] = {}
-            for key, value in class_namespace.items():
-                if isinstance(value, SAPLFunction):
-                    attrs[key] = value.bind_to_class()
-                else:
-                    attrs[key] = value
-            if statement.docstring is not None:
-                attrs.setdefault("__doc__", statement.docstring)
-            cls = type(statement.name, tuple(bases), attrs)
-            self.context.variables[statement.name] = cls
-            self.context.frames[0][statement.name] = cls
-            return
-        raise RuntimeError(f"Unsupported statement type: {type(statement)!r}")
+                if not flow and statement.else_body:
+                    flow = self._execute_block(statement.else_body)
+        finally:
+            if statement.finally_body:
+                finally_flow = self._execute_block(statement.finally_body)
+                if finally_flow:
+                    # Control flow from FINALLY wins, mirroring Python where a
+                    # break/return in finally overrides the in-flight outcome.
+                    return finally_flow
+        return flow
+
+    def _exec_raise(self, statement: nodes.RaiseStatement) -> None:
+        if statement.value is None:
+            raise RuntimeError("RAISE requires an exception value")
+        value = self._evaluate_expression(statement.value, statement.line)
+        if isinstance(value, BaseException):
+            raise value
+        raise RuntimeError(f"Cannot raise value of type {type(value).__name__}")
+
+    def _exec_import(self, statement: nodes.ImportStatement) -> None:
+        for item in statement.items:
+            module = self._import_module(item.module)
+            alias = item.alias or item.module[-1]
+            self.context.variables[alias] = module
+            self.context.modules[alias] = module
+        self.context.touch()
+
+    def _exec_from_import(self, statement: nodes.FromImportStatement) -> None:
+        module = self._import_module(statement.module)
+        for item in statement.items:
+            if item.name == "*":
+                # The (name, value) pairs for a module never change once it
+                # is built; memoize them so repeated wildcard imports are a
+                # single C-level dict merge.
+                cached = self._star_import_cache.get(id(module))
+                if cached is None or cached[0] is not module:
+                    exported = {
+                        attr: getattr(module, attr)
+                        for attr in stdlib.module_public_names(module)
+                    }
+                    cached = (module, exported)
+                    self._star_import_cache[id(module)] = cached
+                self.context.variables.update(cached[1])
+                continue
+            if not hasattr(module, item.name):
+                raise RuntimeError(f"Module '{'.'.join(statement.module)}' has no attribute '{item.name}'")
+            alias = item.alias or item.name
+            value = getattr(module, item.name)
+            self.context.variables[alias] = value
+        self.context.touch()
+
+    def _exec_class_def(self, statement: nodes.ClassDefinition) -> None:
+        bases = [self._evaluate_expression(expr, statement.line) for expr in statement.bases]
+        if not bases:
+            bases = [object]
+        class_namespace: Dict[str, Any] = {}
+        self.context.push_frame(class_namespace)
+        try:
+            self._execute_block(statement.body)
+        finally:
+            self.context.pop_frame()
+        attrs: Dict[str, Any] = {}
+        for key, value in class_namespace.items():
+            if isinstance(value, SAPLFunction):
+                attrs[key] = value.bind_to_class()
+            else:
+                attrs[key] = value
+        if statement.docstring is not None:
+            attrs.setdefault("__doc__", statement.docstring)
+        cls = type(statement.name, tuple(bases), attrs)
+        self.context.variables[statement.name] = cls
+        self.context.touch()
 
     def _import_module(self, module_path: List[str]) -> ModuleType:
+        # context.modules only ever stores ModuleType values (stdlib imports,
+        # custom modules and IMPORT aliases alike), so a successful .get is
+        # always a usable cache hit.
         dotted = ".".join(module_path)
-        if dotted in self.context.modules:
-            cached = self.context.modules[dotted]
-            if isinstance(cached, ModuleType):
-                return cached
+        cached = self.context.modules.get(dotted)
+        if cached is not None:
+            return cached
         try:
             module = stdlib.import_module(module_path)
         except RuntimeError as exc:
@@ -638,8 +905,12 @@ class Interpreter:
         return module
 
     def _load_custom_module(self, spec: ModuleSpec) -> ModuleType:
-        source = spec.path.read_text(encoding="utf-8")
-        program = parse(lex(source))
+        key = (str(spec.path), spec.path.stat().st_mtime_ns)
+        program = _PROGRAM_CACHE.get(key)
+        if program is None:
+            source = spec.path.read_text(encoding="utf-8")
+            program = parse(lex(source))
+            _PROGRAM_CACHE[key] = program
         child_loader = self.module_loader.spawn_child(spec.path.parent)
         sub_interpreter = type(self)(module_loader=child_loader)
         sub_interpreter.execute(program)
@@ -655,16 +926,32 @@ class Interpreter:
         self.context.modules[spec.dotted] = module
         return module
 
-    def _execute_block(self, statements: Iterable[nodes.Statement]) -> None:
-        for statement in statements:
-            self._execute_statement(statement)
+    def _execute_block(self, statements: Iterable[nodes.Statement]) -> Optional[int]:
+        # Blocks are lowered once into (handler, statement) pairs so repeated
+        # executions (loop bodies, function bodies) skip the type lookup.
+        cached = self._block_cache.get(id(statements))
+        if cached is None or cached[0] is not statements:
+            handlers = _STATEMENT_HANDLERS
+            lowered = []
+            for statement in statements:
+                handler = handlers.get(type(statement))
+                if handler is None:
+                    raise RuntimeError(f"Unsupported statement type: {type(statement)!r}")
+                lowered.append((handler, statement))
+            cached = (statements, lowered)
+            self._block_cache[id(statements)] = cached
+        for handler, statement in cached[1]:
+            flow = handler(self, statement)
+            if flow:
+                return flow
+        return None
 
     # Function invocation ----------------------------------------------
 
     def _invoke_function(
         self,
         function: SAPLFunction,
-        args: List[Any],
+        args: Sequence[Any],
         kwargs: Dict[str, Any],
         *,
         bound_instance: Any | None = None,
@@ -676,130 +963,200 @@ class Interpreter:
     def _call_function(
         self,
         function: SAPLFunction,
-        args: List[Any],
+        args: Sequence[Any],
         kwargs: Dict[str, Any],
         *,
         bound_instance: Any | None = None,
         asynchronous: bool = False,
     ) -> Any:
+        # args and kwargs are never mutated, so callers pass their containers
+        # straight through without defensive copies.
         if function.is_async and not asynchronous:
             raise RuntimeError(f"Function '{function.name}' is asynchronous and must be awaited")
-        frame = dict(function.closure)
-        parameters = list(function.parameters)
+        # Nothing retains a call frame past the call: closures copy values
+        # out at definition time, so the dict can be cleared and reused.
+        pool = self._frame_pool
+        frame = pool.pop() if pool else {}
+        frame.update(function.closure)
+        parameters = function.parameters
         if bound_instance is not None:
             if not parameters:
                 raise RuntimeError(f"Function '{function.name}' does not accept arguments")
-            first_param = parameters[0]
-            frame[first_param.name] = bound_instance
+            frame[parameters[0].name] = bound_instance
             parameters = parameters[1:]
-        remaining_args = list(args)
-        remaining_kwargs = dict(kwargs)
+        arg_count = len(args)
+        index = 0
+        matched_kwargs = 0
         for param in parameters:
-            if remaining_args:
-                frame[param.name] = remaining_args.pop(0)
-            elif param.name in remaining_kwargs:
-                frame[param.name] = remaining_kwargs.pop(param.name)
+            if index < arg_count:
+                frame[param.name] = args[index]
+                index += 1
+            elif param.name in kwargs:
+                frame[param.name] = kwargs[param.name]
+                matched_kwargs += 1
             elif param.name in function.defaults:
                 frame[param.name] = function.defaults[param.name]
             else:
                 raise RuntimeError(f"Missing value for parameter '{param.name}' in function '{function.name}'")
-        if remaining_args or remaining_kwargs:
+        if index < arg_count or matched_kwargs != len(kwargs):
             raise RuntimeError(f"Too many arguments supplied to function '{function.name}'")
         self.context.push_frame(frame)
         self._function_stack.append(function)
         try:
-            self._execute_block(function.body)
-        except _ReturnSignal as signal:
-            return signal.value
+            if self._execute_block(function.body) == _FLOW_RETURN:
+                value = self._return_value
+                self._return_value = None
+                return value
         finally:
             self._function_stack.pop()
             self.context.pop_frame()
+            frame.clear()
+            pool.append(frame)
         return None
 
     # Expression evaluation -------------------------------------------
 
     def _evaluate_expression(self, expression: nodes.Expression, line: int) -> Any:
-        if isinstance(expression, nodes.Identifier):
-            return self._resolve_identifier(expression.name, line)
-        if isinstance(expression, nodes.AttributeReference):
-            value = self._evaluate_expression(expression.value, line)
-            if hasattr(value, expression.attribute):
-                attr = getattr(value, expression.attribute)
-                if isinstance(attr, SAPLFunction):
-                    return attr
-                return attr
-            if isinstance(value, dict) and expression.attribute in value:
-                return value[expression.attribute]
-            raise RuntimeError(f"Object of type {type(value).__name__} has no attribute '{expression.attribute}'")
-        if isinstance(expression, nodes.IndexReference):
-            value = self._evaluate_expression(expression.value, line)
-            index = self._evaluate_expression(expression.index, line)
-            try:
-                return value[index]
-            except Exception as exc:  # pylint: disable=broad-except
-                raise RuntimeError(f"Index error: {exc}") from exc
-        if isinstance(expression, nodes.CallExpression):
-            function = self._evaluate_expression(expression.function, line)
-            args = [self._evaluate_expression(arg, line) for arg in expression.args]
-            kwargs = {key: self._evaluate_expression(value, line) for key, value in expression.kwargs.items()}
-            if isinstance(function, SAPLFunction):
-                return function(*args, **kwargs)
-            if callable(function):
-                return function(*args, **kwargs)
+        # Handlers are stamped onto the node classes as _sapl_eval, so
+        # dispatch rides CPython's per-class attribute cache instead of
+        # hashing the type into a dict on every evaluation.
+        handler = getattr(expression, "_sapl_eval", None)
+        if handler is None:
+            # Literals are stored in the AST as raw Python values, so any
+            # non-node value evaluates to itself.
+            return expression
+        return handler(self, expression, line)
+
+    def _eval_identifier(self, expression: nodes.Identifier, line: int) -> Any:
+        return self._resolve_identifier(expression.name, line)
+
+    def _eval_attribute(self, expression: nodes.AttributeReference, line: int) -> Any:
+        value = self._evaluate_expression(expression.value, line)
+        # One getattr with a sentinel instead of hasattr-then-getattr, which
+        # walked the descriptor chain twice per access.
+        attr = getattr(value, expression.attribute, _MISSING)
+        if attr is not _MISSING:
+            return attr
+        if isinstance(value, dict):
+            item = value.get(expression.attribute, _MISSING)
+            if item is not _MISSING:
+                return item
+        raise RuntimeError(f"Object of type {type(value).__name__} has no attribute '{expression.attribute}'")
+
+    def _eval_index(self, expression: nodes.IndexReference, line: int) -> Any:
+        value = self._evaluate_expression(expression.value, line)
+        index = self._evaluate_expression(expression.index, line)
+        try:
+            return value[index]
+        except Exception as exc:  # pylint: disable=broad-except
+            raise RuntimeError(f"Index error: {exc}") from exc
+
+    def _eval_call(self, expression: nodes.CallExpression, line: int) -> Any:
+        function = self._evaluate_expression(expression.function, line)
+        # SAPLFunction defines __call__, so one callable() check covers
+        # user-defined and native callables alike.
+        if not callable(function):
             raise RuntimeError(f"Attempted to call non-callable object of type {type(function).__name__}")
-        if isinstance(expression, nodes.UnaryExpression):
-            operand = self._evaluate_expression(expression.operand, line)
-            if expression.operator == "NEGATE":
-                return -operand
-            if expression.operator == "POSITIVE":
-                return +operand
-            if expression.operator == "NOT":
-                return not self._truthy(operand)
-            raise RuntimeError(f"Unsupported unary operator {expression.operator}")
-        if isinstance(expression, nodes.BinaryExpression):
-            left = self._evaluate_expression(expression.left, line)
-            right = self._evaluate_expression(expression.right, line)
-            return self._apply_operator(expression.operator, left, right, line)
-        if isinstance(expression, nodes.ListExpression):
-            return [self._evaluate_expression(elem, line) for elem in expression.elements]
-        if isinstance(expression, nodes.TupleExpression):
-            return tuple(self._evaluate_expression(elem, line) for elem in expression.elements)
-        if isinstance(expression, nodes.DictExpression):
-            return {self._evaluate_expression(key, line): self._evaluate_expression(value, line) for key, value in expression.entries}
-        if isinstance(expression, nodes.SetExpression):
-            return {self._evaluate_expression(elem, line) for elem in expression.elements}
-        if isinstance(expression, nodes.ListComprehension):
-            iterable = self._evaluate_expression(expression.iterable, line)
-            results: List[Any] = []
-            self.context.push_frame({})
-            try:
-                for item in self._iterable(iterable, line):
-                    self._assign(expression.iterator, item, line)
-                    if expression.condition is not None:
-                        condition_value = self._evaluate_expression(expression.condition, line)
-                        if not self._truthy(condition_value):
-                            continue
-                    results.append(self._evaluate_expression(expression.expression, line))
-            finally:
-                self.context.pop_frame()
-            return results
-        if isinstance(expression, nodes.ConditionalExpression):
-            condition = self._evaluate_expression(expression.condition, line)
-            branch = expression.if_true if self._truthy(condition) else expression.if_false
-            return self._evaluate_expression(branch, line)
-        if isinstance(expression, nodes.LambdaExpression):
-            defaults: Dict[str, Any] = {}
-            for param in expression.parameters:
-                if param.default is not None:
-                    defaults[param.name] = self._evaluate_expression(param.default, line)
-            closure: Dict[str, Any] = {}
-            for frame in self.context.frames:
-                closure.update(frame)
-            return SAPLLambda(self, expression.parameters, expression.body, defaults, closure, line)
-        if isinstance(expression, nodes.AwaitExpression):
-            value = self._evaluate_expression(expression.expression, line)
-            return self._await(value, line)
-        return expression
+        evaluate = self._evaluate_expression
+        if not expression.kwargs:
+            if not expression.args:
+                return function()
+            return function(*[evaluate(arg, line) for arg in expression.args])
+        args = [evaluate(arg, line) for arg in expression.args]
+        kwargs = {key: evaluate(value, line) for key, value in expression.kwargs.items()}
+        return function(*args, **kwargs)
+
+    def _eval_unary(self, expression: nodes.UnaryExpression, line: int) -> Any:
+        operand = self._evaluate_expression(expression.operand, line)
+        if expression.operator == "NEGATE":
+            return -operand
+        if expression.operator == "POSITIVE":
+            return +operand
+        if expression.operator == "NOT":
+            return not operand
+        raise RuntimeError(f"Unsupported unary operator {expression.operator}")
+
+    def _eval_binary(self, expression: nodes.BinaryExpression, line: int) -> Any:
+        op = expression.operator
+        # AND/OR short-circuit: the right operand is only evaluated when the
+        # left side leaves the outcome undecided, so guard patterns skip the
+        # expensive half and its side effects.
+        if op == "AND":
+            if not self._evaluate_expression(expression.left, line):
+                return False
+            return bool(self._evaluate_expression(expression.right, line))
+        if op == "OR":
+            if self._evaluate_expression(expression.left, line):
+                return True
+            return bool(self._evaluate_expression(expression.right, line))
+        op_fn = _BINARY_OPERATORS.get(op)
+        if op_fn is None:
+            raise RuntimeError(f"Unsupported binary operator {op}")
+        left = self._evaluate_expression(expression.left, line)
+        right = self._evaluate_expression(expression.right, line)
+        return op_fn(left, right)
+
+    def _eval_list(self, expression: nodes.ListExpression, line: int) -> List[Any]:
+        return [self._evaluate_expression(elem, line) for elem in expression.elements]
+
+    def _eval_tuple(self, expression: nodes.TupleExpression, line: int) -> tuple:
+        return tuple(self._evaluate_expression(elem, line) for elem in expression.elements)
+
+    def _eval_dict(self, expression: nodes.DictExpression, line: int) -> Dict[Any, Any]:
+        return {self._evaluate_expression(key, line): self._evaluate_expression(value, line) for key, value in expression.entries}
+
+    def _eval_set(self, expression: nodes.SetExpression, line: int) -> set:
+        return {self._evaluate_expression(elem, line) for elem in expression.elements}
+
+    def _eval_comprehension(self, expression: nodes.ListComprehension, line: int) -> List[Any]:
+        iterable = self._evaluate_expression(expression.iterable, line)
+        if not isinstance(iterable, (list, tuple, range)):
+            iterable = self._iterable(iterable, line)
+        results: List[Any] = []
+        # The loop writes the iterator binding straight into the
+        # comprehension frame and hoists every per-iteration lookup; the
+        # unconditional variant drops the filter branch entirely.
+        append = results.append
+        evaluate = self._evaluate_expression
+        context = self.context
+        touch = context.touch
+        name = expression.iterator
+        condition = expression.condition
+        body = expression.expression
+        frame: Dict[str, Any] = {}
+        context.push_frame(frame)
+        try:
+            if condition is None:
+                for item in iterable:
+                    frame[name] = item
+                    touch()
+                    append(evaluate(body, line))
+            else:
+                for item in iterable:
+                    frame[name] = item
+                    touch()
+                    if evaluate(condition, line):
+                        append(evaluate(body, line))
+        finally:
+            context.pop_frame()
+        return results
+
+    def _eval_conditional(self, expression: nodes.ConditionalExpression, line: int) -> Any:
+        condition = self._evaluate_expression(expression.condition, line)
+        branch = expression.if_true if condition else expression.if_false
+        return self._evaluate_expression(branch, line)
+
+    def _eval_lambda(self, expression: nodes.LambdaExpression, line: int) -> SAPLLambda:
+        defaults: Dict[str, Any] = {}
+        for param in expression.parameters:
+            if param.default is not None:
+                defaults[param.name] = self._evaluate_expression(param.default, line)
+        closure = self._capture_closure(expression, expression.body, expression.parameters)
+        return SAPLLambda(self, expression.parameters, expression.body, defaults, closure, line)
+
+    def _eval_await(self, expression: nodes.AwaitExpression, line: int) -> Any:
+        value = self._evaluate_expression(expression.expression, line)
+        return self._await(value, line)
 
     def _evaluate_string(self, expression: nodes.Expression | None, line: int) -> str:
         if expression is None:
@@ -824,6 +1181,13 @@ class Interpreter:
         return list(self._iterable(value, line))
 
     def _iterable(self, value: Any, line: int) -> Iterable[Any]:
+        # Exact-type checks cover the containers SAPL programs actually
+        # iterate; only exotic values reach the guarded iter() fallback.
+        cls = type(value)
+        if cls is str:
+            return [value]
+        if cls is list or cls is tuple or cls is dict or cls is set or cls is range:
+            return iter(value)
         if isinstance(value, str):
             return [value]
         try:
@@ -833,129 +1197,95 @@ class Interpreter:
 
     def _assign(self, name: str, value: Any, line: int) -> None:
         self.context.frames[-1][name] = value
-        if len(self.context.frames) == 1:
-            self.context.variables[name] = value
+        self.context.touch()
 
     def _assign_target(self, target: Any, value: Any, line: int) -> None:
-        if isinstance(target, nodes.Identifier):
-            self._assign(target.name, value, line)
-        elif isinstance(target, nodes.AttributeReference):
-            obj = self._evaluate_expression(target.value, line)
-            setattr(obj, target.attribute, value)
-        elif isinstance(target, nodes.IndexReference):
-            obj = self._evaluate_expression(target.value, line)
-            index = self._evaluate_expression(target.index, line)
-            obj[index] = value
-        else:
+        handler = _ASSIGN_TARGET_HANDLERS.get(type(target))
+        if handler is None:
             raise RuntimeError("Unsupported assignment target")
+        handler(self, target, value, line)
+
+    def _assign_identifier_target(self, target: nodes.Identifier, value: Any, line: int) -> None:
+        self._assign(target.name, value, line)
+
+    def _assign_attribute_target(self, target: nodes.AttributeReference, value: Any, line: int) -> None:
+        obj = self._evaluate_expression(target.value, line)
+        setattr(obj, target.attribute, value)
+
+    def _assign_index_target(self, target: nodes.IndexReference, value: Any, line: int) -> None:
+        obj = self._evaluate_expression(target.value, line)
+        index = self._evaluate_expression(target.index, line)
+        obj[index] = value
 
     def _read_target(self, target: Any, line: int) -> Any:
-        if isinstance(target, nodes.Identifier):
-            return self._resolve_identifier(target.name, line)
-        if isinstance(target, nodes.AttributeReference):
-            obj = self._evaluate_expression(target.value, line)
-            return getattr(obj, target.attribute)
-        if isinstance(target, nodes.IndexReference):
-            obj = self._evaluate_expression(target.value, line)
-            index = self._evaluate_expression(target.index, line)
-            return obj[index]
-        raise RuntimeError("Unsupported assignment target")
+        handler = _READ_TARGET_HANDLERS.get(type(target))
+        if handler is None:
+            raise RuntimeError("Unsupported assignment target")
+        return handler(self, target, line)
+
+    def _read_identifier_target(self, target: nodes.Identifier, line: int) -> Any:
+        return self._resolve_identifier(target.name, line)
+
+    def _read_attribute_target(self, target: nodes.AttributeReference, line: int) -> Any:
+        obj = self._evaluate_expression(target.value, line)
+        return getattr(obj, target.attribute)
+
+    def _read_index_target(self, target: nodes.IndexReference, line: int) -> Any:
+        obj = self._evaluate_expression(target.value, line)
+        index = self._evaluate_expression(target.index, line)
+        return obj[index]
 
     def _materialise_target(self, target: Any, line: int) -> Any:
         if isinstance(target, (nodes.Identifier, nodes.AttributeReference, nodes.IndexReference)):
             return target
         raise RuntimeError("Invalid assignment target")
 
-    def _apply_operator(self, operator: str, left: Any, right: Any, line: int) -> Any:
-        if operator == "PLUS":
-            return left + right
-        if operator == "MINUS":
-            return left - right
-        if operator == "STAR":
-            return left * right
-        if operator == "SLASH":
-            return left / right
-        if operator == "DBLSLASH":
-            return left // right
-        if operator == "PERCENT":
-            return left % right
-        if operator == "POWER":
-            return left ** right
-        if operator == "EQ":
-            return left == right
-        if operator == "NEQ":
-            return left != right
-        if operator == "LT":
-            return left < right
-        if operator == "LTE":
-            return left <= right
-        if operator == "GT":
-            return left > right
-        if operator == "GTE":
-            return left >= right
-        if operator == "AND":
-            return self._truthy(left) and self._truthy(right)
-        if operator == "OR":
-            return self._truthy(left) or self._truthy(right)
-        if operator == "IN":
-            return left in right
-        raise RuntimeError(f"Unsupported binary operator {operator}")
-
-    def _apply_augmented(self, operator: str, current: Any, increment: Any, line: int) -> Any:
-        mapping = {
-            "PLUSEQ": ("PLUS", current, increment),
-            "MINUSEQ": ("MINUS", current, increment),
-            "STAREQ": ("STAR", current, increment),
-            "SLASHEQ": ("SLASH", current, increment),
-            "DBLSLASHEQ": ("DBLSLASH", current, increment),
-            "PERCENTEQ": ("PERCENT", current, increment),
-            "POWEQ": ("POWER", current, increment),
-        }
-        if operator not in mapping:
-            raise RuntimeError(f"Unsupported augmented operator {operator}")
-        op, left, right = mapping[operator]
-        return self._apply_operator(op, left, right, line)
+    def _apply_operator(self, op: str, left: Any, right: Any, line: int) -> Any:
+        op_fn = _BINARY_OPERATORS.get(op)
+        if op_fn is None:
+            raise RuntimeError(f"Unsupported binary operator {op}")
+        return op_fn(left, right)
 
-    def _truthy(self, value: Any) -> bool:
-        return bool(value)
+    def _apply_augmented(self, op: str, current: Any, increment: Any, line: int) -> Any:
+        op_fn = _AUGMENTED_OPERATORS.get(op)
+        if op_fn is None:
+            raise RuntimeError(f"Unsupported augmented operator {op}")
+        return op_fn(current, increment)
 
     def _await(self, value: Any, line: int) -> Any:
         if isinstance(value, PendingAsyncCall):
             return value.resolve()
         if inspect.isawaitable(value):
-            try:
-                return asyncio.run(value)
-            except RuntimeError:
+            loop = self._loop
+            if loop is None or loop.is_closed():
                 loop = asyncio.new_event_loop()
-                previous: asyncio.AbstractEventLoop | None = None
-                try:
-                    try:
-                        previous = asyncio.get_event_loop()
-                    except RuntimeError:
-                        previous = None
-                    asyncio.set_event_loop(loop)
-                    return loop.run_until_complete(value)
-                finally:
-                    loop.close()
-                    asyncio.set_event_loop(previous)
+                self._loop = loop
+            return loop.run_until_complete(value)
         raise RuntimeError(f"AWAIT requires an awaitable value on line {line}")
 
     def _resolve_identifier(self, name: str, line: int) -> Any:
-        for frame in reversed(self.context.frames):
-            if name in frame:
-                return frame[name]
-        if name in self.context.variables:
-            return self.context.variables[name]
-        if name in self.context.modules:
-            return self.context.modules[name]
-        if name in self.context.payloads:
-            return list(self.context.payloads[name])
+        # frames[0] is the global variables dict, so the frame scan already
+        # covers it; no separate variables lookup is needed.  Each probe uses
+        # get() with the _MISSING sentinel so a hit costs one dict lookup
+        # instead of a membership test followed by a subscript.
+        context = self.context
+        for frame in reversed(context.frames):
+            value = frame.get(name, _MISSING)
+            if value is not _MISSING:
+                return value
+        value = context.modules.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = context.payloads.get(name, _MISSING)
+        if value is not _MISSING:
+            return list(value)
         if name == "targets":
-            return list(self.context.targets)
+            return list(context.targets)
         if name == "scope":
-            return list(self.context.scope)
-        if name in self.context.builtins:
-            return self.context.builtins[name]
+            return list(context.scope)
+        value = context.builtins.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
         raise RuntimeError(f"Unknown identifier '{name}' referenced on line {line}")
 
     def _lookup_variable(self, name: str) -> Any | None:
@@ -968,13 +1298,156 @@ class Interpreter:
         for frame in reversed(self.context.frames):
             if name in frame:
                 del frame[name]
-                if frame is self.context.frames[0] and name in self.context.variables:
-                    del self.context.variables[name]
+                self.context.touch()
                 return
 
     def _interpolate(self, value: str) -> str:
+        if "{" not in value and "}" not in value:
+            return value
+        parts = _TEMPLATE_CACHE.get(value, _MISSING)
+        if parts is _MISSING:
+            parts = _compile_template(value)
+            _TEMPLATE_CACHE[value] = parts
         format_map = self.context.format_context()
-        return value.format_map(_FormatDict(format_map))
+        if parts is None:
+            return value.format_map(_FormatDict(format_map))
+        pieces: List[str] = []
+        for literal, field in parts:
+            if literal:
+                pieces.append(literal)
+            if field is not None:
+                if field in format_map:
+                    pieces.append(format(format_map[field]))
+                else:
+                    pieces.append("{" + field + "}")
+        return "".join(pieces)
+
+
+# Parsed interpolation templates keyed by source string; None marks templates
+# that need the full str.format_map machinery (specs, conversions, indexing).
+_TEMPLATE_CACHE: Dict[str, Optional[List[tuple]]] = {}
+
+
+def _compile_template(template: str) -> Optional[List[tuple]]:
+    try:
+        segments = list(string.Formatter().parse(template))
+    except ValueError:
+        return None
+    parts: List[tuple] = []
+    for literal, field, spec, conversion in segments:
+        if spec or conversion or field == "" or (field and ("." in field or "[" in field)):
+            return None
+        parts.append((literal, field))
+    return parts
+
+
+def _static_string(value: Any) -> bool:
+    """True for string literals that interpolation would return unchanged."""
+
+    return isinstance(value, str) and "{" not in value and "}" not in value
+
+
+def _collect_identifiers(obj: Any, names: set) -> None:
+    """Accumulate every Identifier name reachable from *obj* into *names*."""
+
+    if isinstance(obj, nodes.Identifier):
+        names.add(obj.name)
+        return
+    if isinstance(obj, (list, tuple)):
+        for item in obj:
+            _collect_identifiers(item, names)
+        return
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            _collect_identifiers(key, names)
+            _collect_identifiers(value, names)
+        return
+    if is_dataclass(obj) and not isinstance(obj, type):
+        for spec in fields(obj):
+            _collect_identifiers(getattr(obj, spec.name), names)
+
+
+# Statement dispatch table, built once after the class body.  A dict lookup
+# on the node class replaces the long isinstance chain, making dispatch cost
+# independent of statement kind.
+_STATEMENT_HANDLERS = {
+    nodes.SetStatement: Interpreter._exec_set,
+    nodes.TargetStatement: Interpreter._exec_target,
+    nodes.ScopeStatement: Interpreter._exec_scope,
+    nodes.PayloadStatement: Interpreter._exec_payload,
+    nodes.TaskStatement: Interpreter._exec_task,
+    nodes.PortScanStatement: Interpreter._exec_portscan,
+    nodes.HttpRequestStatement: Interpreter._exec_http,
+    nodes.FuzzStatement: Interpreter._exec_fuzz,
+    nodes.NoteStatement: Interpreter._exec_note,
+    nodes.FindingStatement: Interpreter._exec_finding,
+    nodes.RunStatement: Interpreter._exec_run,
+    nodes.ReportStatement: Interpreter._exec_report,
+    nodes.InputStatement: Interpreter._exec_input,
+    nodes.OutputStatement: Interpreter._exec_output,
+    nodes.ForStatement: Interpreter._exec_for,
+    nodes.IfStatement: Interpreter._exec_if,
+    nodes.WhileStatement: Interpreter._exec_while,
+    nodes.BreakStatement: Interpreter._exec_break,
+    nodes.ContinueStatement: Interpreter._exec_continue,
+    nodes.PassStatement: Interpreter._exec_pass,
+    nodes.ReturnStatement: Interpreter._exec_return,
+    nodes.FunctionDefinition: Interpreter._exec_function_def,
+    nodes.ExpressionStatement: Interpreter._exec_expression,
+    nodes.AssignmentStatement: Interpreter._exec_assignment,
+    nodes.AugmentedAssignmentStatement: Interpreter._exec_augmented_assignment,
+    nodes.WithStatement: Interpreter._exec_with,
+    nodes.TryStatement: Interpreter._exec_try,
+    nodes.RaiseStatement: Interpreter._exec_raise,
+    nodes.ImportStatement: Interpreter._exec_import,
+    nodes.FromImportStatement: Interpreter._exec_from_import,
+    nodes.ClassDefinition: Interpreter._exec_class_def,
+}
+
+
+# Expression dispatch mirrors the statement table: one dict lookup on the node
+# class instead of walking an isinstance chain whose cost grew with how late
+# the node kind appeared.  Literals deliberately have no entry; the .get miss
+# routes them through the evaluate-to-self fallback.
+_EXPRESSION_HANDLERS = {
+    nodes.Identifier: Interpreter._eval_identifier,
+    nodes.AttributeReference: Interpreter._eval_attribute,
+    nodes.IndexReference: Interpreter._eval_index,
+    nodes.CallExpression: Interpreter._eval_call,
+    nodes.UnaryExpression: Interpreter._eval_unary,
+    nodes.BinaryExpression: Interpreter._eval_binary,
+    nodes.ListExpression: Interpreter._eval_list,
+    nodes.TupleExpression: Interpreter._eval_tuple,
+    nodes.DictExpression: Interpreter._eval_dict,
+    nodes.SetExpression: Interpreter._eval_set,
+    nodes.ListComprehension: Interpreter._eval_comprehension,
+    nodes.ConditionalExpression: Interpreter._eval_conditional,
+    nodes.LambdaExpression: Interpreter._eval_lambda,
+    nodes.AwaitExpression: Interpreter._eval_await,
+}
+
+# Stamp each handler onto its node class so evaluation dispatches through the
+# class attribute (cached by the interpreter's method cache).  staticmethod
+# keeps the (interpreter, expression, line) calling convention; a bare
+# function would rebind the node as self.  Statements stay table-driven:
+# block lowering already pairs each statement with its handler up front.
+for _node_cls, _handler in _EXPRESSION_HANDLERS.items():
+    _node_cls._sapl_eval = staticmethod(_handler)
+del _node_cls, _handler
+
+
+_ASSIGN_TARGET_HANDLERS = {
+    nodes.Identifier: Interpreter._assign_identifier_target,
+    nodes.AttributeReference: Interpreter._assign_attribute_target,
+    nodes.IndexReference: Interpreter._assign_index_target,
+}
+
+
+_READ_TARGET_HANDLERS = {
+    nodes.Identifier: Interpreter._read_identifier_target,
+    nodes.AttributeReference: Interpreter._read_attribute_target,
+    nodes.IndexReference: Interpreter._read_index_target,
+}
 
 
 class _FormatDict(dict):
@@ -10,6 +10,30 @@ from pathlib import Path
 from typing import Optional, Tuple
 
 
+class _SAPLRequestHandler(SimpleHTTPRequestHandler):
+    """File-serving handler that streams bodies without a userland buffer."""
+
+    # Fully buffered writes: response line and headers leave in one send
+    # instead of a syscall per write.
+    wbufsize = -1
+
+    def copyfile(self, source, outputfile) -> None:
+        if outputfile is self.wfile:
+            try:
+                source.fileno()
+            except (AttributeError, OSError):
+                # Directory listings arrive as BytesIO; no fd to hand off.
+                pass
+            else:
+                # socket.sendfile uses os.sendfile where the platform has it
+                # (zero-copy, kernel-to-socket) and degrades to a send loop
+                # elsewhere.
+                self.wfile.flush()
+                self.connection.sendfile(source)
+                return
+        super().copyfile(source, outputfile)
+
+
 @dataclass
 class SAPLServer:
     """Small HTTP server used for documentation previews and demos."""
@@ -20,7 +44,7 @@ class SAPLServer:
 
     def __post_init__(self) -> None:
         self._directory = Path(self.directory).resolve()
-        handler = partial(SimpleHTTPRequestHandler, directory=str(self._directory))
+        handler = partial(_SAPLRequestHandler, directory=str(self._directory))
         self._server = ThreadingHTTPServer((self.bind, self.port), handler, bind_and_activate=False)
         self._server.allow_reuse_address = True
         self._server.server_bind()
@@ -199,16 +199,21 @@ def _allowed_modules() -> Iterable[str]:
     return modules
 
 
+# Assembled once; load_builtins hands out copies.  One C-level dict copy per
+# interpreter replaces re-resolving every builtin name on construction.
+_BUILTINS_PROTOTYPE: Dict[str, Any] = {}
+for _name in BUILTIN_FUNCTION_NAMES:
+    _value = getattr(builtins, _name, None)
+    if callable(_value):
+        _BUILTINS_PROTOTYPE[_name] = _value
+_BUILTINS_PROTOTYPE.update(CUSTOM_FUNCTIONS)
+del _name, _value
+
+
 def load_builtins() -> Dict[str, Any]:
     """Expose a curated set of built-in functions for SAPL programs."""
 
-    environment: Dict[str, Any] = {}
-    for name in BUILTIN_FUNCTION_NAMES:
-        value = getattr(builtins, name, None)
-        if callable(value):
-            environment[name] = value
-    environment.update(CUSTOM_FUNCTIONS)
-    return environment
+    return dict(_BUILTINS_PROTOTYPE)
 
 
 def import_module(path: List[str]):
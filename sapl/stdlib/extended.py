@@ -5,7 +5,7 @@ from __future__ import annotations
 import inspect
 import io
 import re
-from functools import partial as _partial, reduce as _reduce
+from functools import lru_cache as _lru_cache, partial as _partial, reduce as _reduce
 from pathlib import Path
 from typing import Any, Callable, Iterable, Sequence
 
@@ -394,6 +394,19 @@ _FLAG_ALIASES = {
 }
 
 
+@_lru_cache(maxsize=128)
+def _resolve_flag_string(flags: str) -> int:
+    # The string form ("i", "ignorecase multiline", ...) dominates SAPL
+    # call sites; memoizing it turns repeat normalisation into one cache hit.
+    flag_value = 0
+    for token in flags.replace("|", " ").split():
+        key = token.upper()
+        if key not in _FLAG_ALIASES:
+            raise ValueError(f"Unknown regex flag '{token}'")
+        flag_value |= _FLAG_ALIASES[key]
+    return flag_value
+
+
 def _resolve_regex_flags(flags: Any) -> int:
     """Normalise *flags* into a value understood by :mod:`re`."""
 
@@ -402,13 +415,7 @@ def _resolve_regex_flags(flags: Any) -> int:
     if isinstance(flags, int):
         return flags
     if isinstance(flags, str):
-        flag_value = 0
-        for token in flags.replace("|", " ").split():
-            key = token.upper()
-            if key not in _FLAG_ALIASES:
-                raise ValueError(f"Unknown regex flag '{token}'")
-            flag_value |= _FLAG_ALIASES[key]
-        return flag_value
+        return _resolve_flag_string(flags)
     if isinstance(flags, Sequence):
         flag_value = 0
         for token in flags:
@@ -428,10 +435,33 @@ def _describe_match(match: re.Match[str] | None) -> dict[str, Any] | None:
     }
 
 
-def regex_compile(pattern: str, flags: Any | None = None) -> re.Pattern[str]:
-    """Compile *pattern* using optional *flags* and return a regex object."""
+@_lru_cache(maxsize=512)
+def _compile_pattern(pattern: str, flag_bits: int) -> re.Pattern[str]:
+    # Memoized on (pattern, resolved flag bits) so tight SAPL loops reusing a
+    # pattern skip both flag normalisation and re's own cache lookup.
+    return re.compile(pattern, flag_bits)
+
+
+def regex_compile(pattern: str | re.Pattern[str], flags: Any | None = None) -> re.Pattern[str]:
+    """Compile *pattern* using optional *flags* and return a regex object.
+
+    An already-compiled pattern passes straight through, so every regex_*
+    helper also accepts the object returned by a prior ``regex_compile`` and
+    skips flag normalisation and the cache probe entirely.
+    """
+
+    if isinstance(pattern, re.Pattern):
+        if flags not in (None, 0):
+            raise ValueError("flags cannot be combined with a precompiled pattern")
+        return pattern
+    return _compile_pattern(pattern, _resolve_regex_flags(flags))
+
+
+def regex_precompile(pattern: str, flags: Any | None = None) -> bool:
+    """Warm the compiled-pattern cache for *pattern* and return ``True``."""
 
-    return re.compile(pattern, _resolve_regex_flags(flags))
+    _compile_pattern(pattern, _resolve_regex_flags(flags))
+    return True
 
 
 def regex_match(pattern: str, text: str, flags: Any | None = None) -> dict[str, Any] | None:
@@ -647,6 +677,7 @@ EXTRA_FUNCTIONS = {
     "purpleteam_scorecard": purpleteam_scorecard,
     # Regular expressions
     "regex_compile": regex_compile,
+    "regex_precompile": regex_precompile,
     "regex_match": regex_match,
     "regex_search": regex_search,
     "regex_findall": regex_findall,
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import os
 import time
 import traceback
+from collections import Counter
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import List, Sequence
@@ -35,6 +37,34 @@ class TestOutcome:
         return payload
 
 
+def _walk_test_candidates(root: Path) -> tuple[List[Path], List[Path]]:
+    """Collect ``test_*.sapl`` and ``*_test.sapl`` files beneath *root*.
+
+    A single scandir walk matching on the raw entry name replaces one rglob
+    traversal per pattern, each of which built a Path and stat'd every entry.
+    """
+
+    prefixed: List[Path] = []
+    suffixed: List[Path] = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                name = entry.name
+                if not name.endswith(".sapl"):
+                    continue
+                if name.startswith("test_"):
+                    prefixed.append(Path(entry.path))
+                elif name.endswith("_test.sapl"):
+                    suffixed.append(Path(entry.path))
+    prefixed.sort()
+    suffixed.sort()
+    return prefixed, suffixed
+
+
 def discover_test_files(targets: Sequence[str] | None = None) -> List[Path]:
     """Discover SAPL test files based on ``test_*.sapl`` patterns."""
 
@@ -51,96 +81,120 @@ def discover_test_files(targets: Sequence[str] | None = None) -> List[Path]:
             continue
         if not path.is_dir():
             continue
-        patterns = ("test_*.sapl", "*_test.sapl")
-        for pattern in patterns:
-            for candidate in sorted(path.rglob(pattern)):
-                resolved = candidate.resolve()
-                if resolved in seen:
-                    continue
-                discovered.append(resolved)
-                seen.add(resolved)
+        prefixed, suffixed = _walk_test_candidates(path)
+        for candidate in prefixed + suffixed:
+            resolved = candidate.resolve()
+            if resolved in seen:
+                continue
+            discovered.append(resolved)
+            seen.add(resolved)
     return discovered
 
 
+def _run_file_tests(file_path: Path, plugin_hooks: List[PluginHook]) -> List[TestOutcome]:
+    """Execute the test functions of a single file and return their outcomes."""
+
+    outcomes: List[TestOutcome] = []
+    source = file_path.read_text(encoding="utf-8")
+    program = parse(lex(source))
+    loader = ModuleLoader.from_script_path(file_path)
+    interpreter = Interpreter(module_loader=loader, plugins=plugin_hooks)
+    interpreter.execute(program)
+    tests: List[tuple[str, SAPLFunction]] = []
+    for name, value in interpreter.context.variables.items():
+        if isinstance(value, SAPLFunction) and name.startswith("test_"):
+            tests.append((name, value))
+    if not tests:
+        return [
+            TestOutcome(
+                path=file_path,
+                name="<no tests>",
+                status="skipped",
+                duration=0.0,
+                message="No test functions discovered",
+            )
+        ]
+    for name, function in sorted(tests, key=lambda item: item[0]):
+        start = time.perf_counter()
+        status = "passed"
+        message: str | None = None
+        try:
+            result = function()
+            while isinstance(result, PendingAsyncCall):
+                result = result.resolve()
+            if result is False:
+                status = "failed"
+                message = "Returned falsy result"
+            elif result not in (None, True):
+                try:
+                    if not bool(result):
+                        status = "failed"
+                        message = f"Returned falsy result {result!r}"
+                except Exception:  # pragma: no cover - bool override raised
+                    status = "failed"
+                    message = f"Result {result!r} could not be evaluated as truthy"
+        except Exception as exc:  # pylint: disable=broad-except
+            status = "failed"
+            message = "".join(
+                traceback.format_exception_only(type(exc), exc)
+            ).strip()
+        duration = time.perf_counter() - start
+        outcomes.append(
+            TestOutcome(
+                path=file_path,
+                name=name,
+                status=status,
+                duration=duration,
+                message=message,
+            )
+        )
+    return outcomes
+
+
 def run_tests(
     files: Sequence[Path],
     *,
     plugins: Sequence[PluginHook] | None = None,
+    workers: int | None = 1,
 ) -> List[TestOutcome]:
-    """Execute SAPL test functions within *files*."""
+    """Execute SAPL test functions within *files*.
+
+    ``workers`` controls parallelism: the default of 1 keeps the historic
+    sequential behaviour, any other value fans files out over a process
+    pool (``None`` means one worker per core).  Each file already runs in
+    its own Interpreter, so workers share nothing; plugin hooks must be
+    picklable (module-level callables) when a pool is used.
+    """
 
-    outcomes: List[TestOutcome] = []
     plugin_hooks = list(plugins or [])
+    files = list(files)
+    if workers != 1 and len(files) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        from itertools import repeat
+
+        # Executor.map preserves submission order, so the flattened outcome
+        # list matches the sequential layout file for file.
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            batches = list(executor.map(_run_file_tests, files, repeat(plugin_hooks)))
+        return [outcome for batch in batches for outcome in batch]
+    outcomes: List[TestOutcome] = []
     for file_path in files:
-        source = file_path.read_text(encoding="utf-8")
-        program = parse(lex(source))
-        loader = ModuleLoader.from_script_path(file_path)
-        interpreter = Interpreter(module_loader=loader, plugins=plugin_hooks)
-        interpreter.execute(program)
-        tests: List[tuple[str, SAPLFunction]] = []
-        for name, value in interpreter.context.variables.items():
-            if isinstance(value, SAPLFunction) and name.startswith("test_"):
-                tests.append((name, value))
-        if not tests:
-            outcomes.append(
-                TestOutcome(
-                    path=file_path,
-                    name="<no tests>",
-                    status="skipped",
-                    duration=0.0,
-                    message="No test functions discovered",
-                )
-            )
-            continue
-        for name, function in sorted(tests, key=lambda item: item[0]):
-            start = time.perf_counter()
-            status = "passed"
-            message: str | None = None
-            try:
-                result = function()
-                while isinstance(result, PendingAsyncCall):
-                    result = result.resolve()
-                if result is False:
-                    status = "failed"
-                    message = "Returned falsy result"
-                elif result not in (None, True):
-                    try:
-                        if not bool(result):
-                            status = "failed"
-                            message = f"Returned falsy result {result!r}"
-                    except Exception:  # pragma: no cover - bool override raised
-                        status = "failed"
-                        message = f"Result {result!r} could not be evaluated as truthy"
-            except Exception as exc:  # pylint: disable=broad-except
-                status = "failed"
-                message = "".join(
-                    traceback.format_exception_only(type(exc), exc)
-                ).strip()
-            duration = time.perf_counter() - start
-            outcomes.append(
-                TestOutcome(
-                    path=file_path,
-                    name=name,
-                    status=status,
-                    duration=duration,
-                    message=message,
-                )
-            )
+        outcomes.extend(_run_file_tests(file_path, plugin_hooks))
     return outcomes
 
 
 def summarise_outcomes(outcomes: Sequence[TestOutcome]) -> dict:
     """Return aggregate statistics for *outcomes*."""
 
-    total_duration = sum(outcome.duration for outcome in outcomes)
-    summary = {
+    # One Counter pass over the statuses instead of a filtered sum per bucket.
+    counts = Counter(outcome.status for outcome in outcomes)
+    return {
         "total": len(outcomes),
-        "passed": sum(1 for outcome in outcomes if outcome.status == "passed"),
-        "failed": sum(1 for outcome in outcomes if outcome.status == "failed"),
-        "skipped": sum(1 for outcome in outcomes if outcome.status == "skipped"),
-        "duration": total_duration,
+        "passed": counts.get("passed", 0),
+        "failed": counts.get("failed", 0),
+        "skipped": counts.get("skipped", 0),
+        "duration": sum(outcome.duration for outcome in outcomes),
     }
-    return summary
 
 
 __all__ = [
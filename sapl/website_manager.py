@@ -2,14 +2,70 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from .server import SAPLServer
 
 WEBSITE_ROOT = Path(__file__).resolve().parent.parent / "website"
 
+# Single-entry scan cache; the bundle is static in normal use, so repeated
+# asset listings skip the tree walk entirely.  The key covers the mtime of
+# every directory in the tree — adding or removing a file anywhere bumps its
+# parent's mtime, whereas the root's mtime alone misses subdirectory churn.
+_SCAN_CACHE: Dict[str, Tuple[Tuple[Tuple[str, int], ...], Tuple[List[Path], List[Path], List[Path]]]] = {}
+
+
+def _directory_signature(root: Path) -> Tuple[Tuple[str, int], ...]:
+    """Return ``(path, mtime_ns)`` for every directory under *root*.
+
+    Visiting only directories keeps revalidation cheap: the website bundle
+    holds a handful of directories but hundreds of files.
+    """
+
+    signature: List[Tuple[str, int]] = []
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        signature.append((current, os.stat(current).st_mtime_ns))
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return tuple(signature)
+
+
+def _scan_website(root: Path) -> Tuple[List[Path], List[Path], List[Path]]:
+    """Return ``(files, pages, assets)`` for the website tree under *root*."""
+
+    signature = _directory_signature(root)
+    cached = _SCAN_CACHE.get(str(root))
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    # One scandir pass per directory instead of rglob's per-entry Path
+    # construction and repeated is_file() stats.
+    files: List[Path] = []
+    pages: List[Path] = []
+    assets: List[Path] = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    path = Path(entry.path)
+                    files.append(path)
+                    if path.suffix == ".html":
+                        pages.append(path)
+                    else:
+                        assets.append(path)
+    _SCAN_CACHE.clear()
+    _SCAN_CACHE[str(root)] = (signature, (files, pages, assets))
+    return files, pages, assets
+
 
 def website_root() -> Path:
     """Return the path to the bundled website assets."""
@@ -23,11 +79,32 @@ def list_website_assets() -> List[str]:
     """Return a sorted list of relative file paths shipped with the website."""
 
     root = website_root()
-    return sorted(
-        str(path.relative_to(root))
-        for path in root.rglob("*")
-        if path.is_file()
-    )
+    files, _, _ = _scan_website(root)
+    return sorted(str(path.relative_to(root)) for path in files)
+
+
+def _reflink_or_copy(source: str, destination: str) -> None:
+    """Copy *source* to *destination* without routing bytes through userspace.
+
+    os.copy_file_range clones blocks on copy-on-write filesystems (btrfs,
+    xfs) and degrades to an in-kernel copy elsewhere; on failure the plain
+    shutil.copy2 path takes over.
+    """
+
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        shutil.copystat(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+_COPY_FUNCTION = _reflink_or_copy if hasattr(os, "copy_file_range") else shutil.copy2
 
 
 def export_website(destination: Path, *, overwrite: bool = False) -> Path:
@@ -41,7 +118,7 @@ def export_website(destination: Path, *, overwrite: bool = False) -> Path:
                 f"Destination {destination} already exists. Use overwrite=True to replace it."
             )
         shutil.rmtree(destination)
-    shutil.copytree(root, destination)
+    shutil.copytree(root, destination, copy_function=_COPY_FUNCTION)
     return destination
 
 
@@ -49,12 +126,10 @@ def website_metadata() -> Dict[str, object]:
     """Return aggregate information about the website bundle."""
 
     root = website_root()
-    files = list(root.rglob("*"))
-    pages = [path for path in files if path.suffix == ".html"]
-    assets = [path for path in files if path.is_file() and path.suffix != ".html"]
+    files, pages, assets = _scan_website(root)
     return {
         "root": str(root),
-        "file_count": len([path for path in files if path.is_file()]),
+        "file_count": len(files),
         "page_count": len(pages),
         "asset_count": len(assets),
     }
@@ -23,6 +23,34 @@ DEF test_truth():
     assert summary["passed"] >= 1
 
 
+def test_run_tests_parallel_matches_sequential(tmp_path):
+    passing = tmp_path / "test_passing.sapl"
+    _write_test_file(
+        passing,
+        """
+DEF test_truth():
+    RETURN TRUE
+""".strip()
+    )
+    failing = tmp_path / "test_failing.sapl"
+    _write_test_file(
+        failing,
+        """
+DEF test_lie():
+    RETURN FALSE
+""".strip()
+    )
+    files = testing.discover_test_files([str(tmp_path)])
+    sequential = testing.run_tests(files)
+    parallel = testing.run_tests(files, workers=2)
+    assert [(o.path, o.name, o.status, o.message) for o in parallel] == [
+        (o.path, o.name, o.status, o.message) for o in sequential
+    ]
+    summary = testing.summarise_outcomes(parallel)
+    assert summary["passed"] == 1
+    assert summary["failed"] == 1
+
+
 def test_cli_test_command(tmp_path):
     script = tmp_path / "test_cli_failure.sapl"
     _write_test_file(